@@ -4,8 +4,23 @@ Check if all dependencies for space weather are available
 """
 
 import sys
+from importlib.util import find_spec
 
-def check_dependencies():
+def is_available(import_name: str, deep: bool = False) -> bool:
+    """Check whether a module can be imported
+    
+    By default only the module spec is located, which does not run the
+    module's initialization; deep=True performs a real import.
+    """
+    try:
+        if deep:
+            __import__(import_name)
+            return True
+        return find_spec(import_name) is not None
+    except ImportError:
+        return False
+
+def check_dependencies(deep: bool = False):
     """Check all required dependencies"""
     
     required_packages = [
@@ -20,11 +35,10 @@ def check_dependencies():
     available = []
     
     for package_name, import_name in required_packages:
-        try:
-            __import__(import_name)
+        if is_available(import_name, deep):
             available. append(package_name)
             print(f"✅ {package_name} - OK")
-        except ImportError:
+        else:
             missing.append(package_name)
             print(f"❌ {package_name} - MISSING")
     
@@ -39,4 +53,4 @@ def check_dependencies():
         return True
 
 if __name__ == "__main__":
-    check_dependencies()
\ No newline at end of file
+    check_dependencies(deep='--deep' in sys.argv)
\ No newline at end of file
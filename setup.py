@@ -25,6 +25,9 @@ setup(
     package_dir={"": "src"},
     include_package_data=True,
     install_requires=REQUIREMENTS,
+    extras_require={
+        "jit": ["numba>=0.58.0"],
+    },
     python_requires=">=3.9",
     classifiers=[
         "Development Status :: 4 - Beta",
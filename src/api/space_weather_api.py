@@ -3,20 +3,73 @@ Space Weather API integration for SuperSID Pro
 Handles data retrieval from spaceweatherlive.com and NOAA SWPC
 """
 
-import aiohttp
 import asyncio
+import atexit
+import bisect
+import html as html_lib
 import json
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import re
-from bs4 import BeautifulSoup
+import sys
+import threading
+import time
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both decoders share repeated keys such as "time_tag" and "flux" between records
+# (orjson through its key cache, json through its per-document memo), so the
+# NOAA payloads need no separate interning pass.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_iso = datetime.fromisoformat
+    else:
+        def _parse_iso(value: str) -> datetime:
+            """Parse an ISO 8601 timestamp that may end in 'Z'"""
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
 from core.logger import get_logger, log_exception, log_performance
 from core.config_manager import ConfigManager
 
+if TYPE_CHECKING:
+    import aiohttp
+
+_RE_BODY = re.compile(r'<body\b', re.I)
+_RE_NON_TEXT = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+_RE_TAG = re.compile(r'<[^>]*>')
+_RE_SPEED = re.compile(r'(\d+)\s*km/s')
+_RE_KP = re.compile(r'Kp.*?(\d+\.?\d*)')
+_RE_SFU = re.compile(r'(\d+\.?\d*)\s*sfu')
+
+# X-ray flux class boundaries in W/m², index i of np.digitize maps to _FLUX_CLASSES[i]
+_FLUX_BINS = (1e-8, 1e-7, 1e-6, 1e-5, 1e-4)
+_FLUX_CLASSES = (None, "A", "B", "C", "M", "X")
+
+# Kp thresholds, bisect_right into _KP_BINS indexes _KP_LEVELS
+_KP_BINS = (3, 4, 5, 6, 7, 8, 9)
+_KP_LEVELS = ("Quiet", "Unsettled", "Active", "Minor Storm", "Moderate Storm",
+              "Strong Storm", "Severe Storm", "Extreme Storm")
+
+# Cache lifetime in seconds, matched by substring against the request URL
+CACHE_POLICY = {
+    "goes_xrs": 30,
+    "xray": 30,
+    "planetary_k_index": 60,
+    "kp_index": 60,
+    "solar_wind": 60,
+    "spaceweatherlive": 600,
+}
+
 class FlareClass(Enum):
     """Solar flare classification"""
     A = "A"
@@ -71,6 +124,18 @@ class SpaceWeatherSummary:
 class SpaceWeatherAPI:
     """Space weather data provider"""
     
+    # One session per event loop, since a ClientSession is bound to the loop it was
+    # created on: loop -> [session, active users]. Loops run on different threads.
+    _sessions: Dict[asyncio.AbstractEventLoop, list] = {}
+    _sessions_lock = threading.Lock()
+    
+    # Responses are cached per process, so short-lived instances still hit the cache
+    _cache: Dict[str, tuple] = {}
+    _cache_lock = threading.Lock()
+    _cache_timeout = 600
+    _cache_stale_timeout = 3600
+    _cache_max_entries = 64
+    
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.logger = get_logger(__name__)
@@ -78,22 +143,86 @@ class SpaceWeatherAPI:
         self.noaa_base_url = "https://services.swpc.noaa.gov/json/"
         self.spaceweather_base_url = "https://www.spaceweatherlive.com"
         
-        self._cache = {}
-        self._cache_timeout = 600
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        self._session: Optional["aiohttp.ClientSession"] = None
+    
+    @classmethod
+    async def get_session(cls) -> "aiohttp.ClientSession":
+        """Get the session shared by every instance on the running loop"""
+        # Imported here so the module stays cheap to load when space weather is never queried
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        with cls._sessions_lock:
+            # Sessions of loops that are already closed can never be closed; just forget them
+            for stale in [l for l in cls._sessions if l.is_closed()]:
+                del cls._sessions[stale]
+            
+            entry = cls._sessions.get(loop)
+            if entry is None or entry[0].closed:
+                session = aiohttp.ClientSession(
+                    # The NOAA helpers fan out in parallel; cap them so they share a few keep-alive sockets
+                    connector=aiohttp.TCPConnector(
+                        limit=32,
+                        limit_per_host=4,
+                        keepalive_timeout=60,
+                        enable_cleanup_closed=True,
+                        ttl_dns_cache=300
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
+                entry = cls._sessions[loop] = [session, 0]
+            return entry[0]
+    
+    @classmethod
+    def close_shared_session(cls):
+        """Close every shared session whose loop is still usable"""
+        with cls._sessions_lock:
+            sessions = list(cls._sessions.items())
+            cls._sessions.clear()
         
-        self._session: Optional[aiohttp.ClientSession] = None
+        for loop, (session, _users) in sessions:
+            if session.closed or loop.is_closed():
+                continue
+            try:
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+                else:
+                    loop.run_until_complete(session.close())
+            except Exception:
+                pass
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+        self._session = await SpaceWeatherAPI.get_session()
+        with SpaceWeatherAPI._sessions_lock:
+            entry = SpaceWeatherAPI._sessions.get(asyncio.get_running_loop())
+            if entry is not None and entry[0] is self._session:
+                entry[1] += 1
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self._session:
-            await self._session. close()
+        """Async context manager exit
+        
+        The session stays open on the persistent background loop. On any other
+        loop it is closed with its last user, since that loop may be closed
+        right after and the session could never be closed then.
+        """
+        session, self._session = self._session, None
+        loop = asyncio.get_running_loop()
+        
+        with SpaceWeatherAPI._sessions_lock:
+            entry = SpaceWeatherAPI._sessions.get(loop)
+            # No entry, or a different one: ours was already closed and dropped or replaced
+            if entry is not None and entry[0] is session:
+                entry[1] -= 1
+                if entry[1] > 0 or loop is _bg_loop:
+                    return
+                del SpaceWeatherAPI._sessions[loop]
+        
+        if session is not None and not session.closed:
+            await session.close()
     
     async def get_current_conditions(self) -> SpaceWeatherSummary:
         """Get current space weather conditions"""
@@ -135,18 +264,16 @@ class SpaceWeatherAPI:
         """Get current conditions from NOAA SWPC"""
         try:
             endpoints = [
-                "planetary_k_index. json",
-                "solar_wind_speed. json",
+                "planetary_k_index.json",
+                "solar_wind_speed.json",
                 "solar_wind_mag_field.json",
                 "goes_xrs.json",
             ]
             
             conditions = {}
+            results = await self._fetch_all(endpoints)
             
-            for endpoint in endpoints:
-                url = f"{self.noaa_base_url}{endpoint}"
-                data = await self._fetch_json(url)
-                
+            for endpoint, data in zip(endpoints, results):
                 if data and len(data) > 0:
                     latest = data[-1] 
                     
@@ -177,40 +304,41 @@ class SpaceWeatherAPI:
         """Scrape current data from spaceweatherlive.com"""
         try:
             url = f"{self.spaceweather_base_url}/en"
+            
+            # The extracted values are cached rather than the page itself
+            cached = self._cache_fresh(url)
+            if cached is not None:
+                return cached
+            
             html = await self._fetch_html(url)
             
             if not html:
-                return {}
+                return self._cache_stale(url) or {}
             
-            soup = BeautifulSoup(html, 'html. parser')
+            # Only the body holds readings; the head is mostly scripts and styles
+            body = _RE_BODY.search(html)
+            if body:
+                html = html[body.start():]
+            
+            # Tags become newlines so a match cannot span two text nodes
+            text = html_lib.unescape(_RE_TAG.sub('\n', _RE_NON_TEXT.sub('', html)))
             conditions = {}
             
-            speed_elements = soup.find_all(text=re.compile(r'\d+\s*km/s'))
-            if speed_elements:
-                for elem in speed_elements:
-                    match = re.search(r'(\d+)\s*km/s', elem)
-                    if match:
-                        conditions["swl_sw_speed"] = int(match.group(1))
-                        break
-            
-            kp_elements = soup.find_all(text=re.compile(r'Kp.*? (\d+\.  ?\d*)'))
-            if kp_elements:
-                for elem in kp_elements:
-                    match = re.search(r'Kp.*?(\d+\. ?\d*)', elem)
-                    if match:
-                        conditions["swl_kp"] = float(match.group(1))
-                        break
-            
-            flux_elements = soup. find_all(text=re. compile(r'(\d+\. ?\d*)\s*sfu'))
-            if flux_elements:
-                for elem in flux_elements:
-                    match = re.search(r'(\d+\.?\d*)\s*sfu', elem)
-                    if match:
-                        conditions["swl_solar_flux"] = float(match. group(1))
-                        break
+            match = _RE_SPEED.search(text)
+            if match:
+                conditions["swl_sw_speed"] = int(match.group(1))
+            
+            match = _RE_KP.search(text)
+            if match:
+                conditions["swl_kp"] = float(match.group(1))
+            
+            match = _RE_SFU.search(text)
+            if match:
+                conditions["swl_solar_flux"] = float(match.group(1))
             
             conditions["swl_last_update"] = datetime.utcnow(). isoformat()
             
+            self._cache_store(url, conditions)
             return conditions
             
         except Exception as e:
@@ -226,53 +354,53 @@ class SpaceWeatherAPI:
                 "goes_xrs_1m.json"
             ]
             
-            data = None
-            for endpoint in possible_endpoints:
-                url = f"{self.noaa_base_url}{endpoint}"
-                test_data = await self._fetch_json(url)
-                if test_data:
-                    data = test_data
-                    break
+            data = await self._fetch_first(possible_endpoints)
             
             if not data:
                 self.logger.warning("No X-ray data available from NOAA")
                 return []
             
-            flares = []
-            current_time = datetime.utcnow()
-            cutoff_time = current_time - timedelta(hours=hours)
+            cutoff = np.datetime64(datetime.utcnow() - timedelta(hours=hours), 's')
             
-            for i, point in enumerate(data):
+            # Validate point by point so one malformed entry only drops itself
+            time_values = []
+            flux_values = []
+            for point in data:
                 try:
-                    timestamp = datetime.fromisoformat(point["time_tag"]. replace('Z', '+00:00'))
-                    
-                    if timestamp < cutoff_time:
-                        continue
-                    
+                    timestamp = np.datetime64(point["time_tag"].rstrip('Z'), 's')
                     flux = float(point.get("flux", 0))
-                    
-                    flare_class = self._classify_xray_flux(flux)
-                    
-                    if flare_class and flare_class != "A":
-                        is_peak = True
-                        if i > 0 and i < len(data) - 1:
-                            prev_flux = float(data[i-1].get("flux", 0))
-                            next_flux = float(data[i+1].get("flux", 0))
-                            is_peak = flux >= prev_flux and flux >= next_flux
-                        
-                        if is_peak:
-                            intensity = flux * 1e6  # Convert to micro-watts per square meter
-                            
-                            flare = SolarFlare(
-                                timestamp=timestamp,
-                                flare_class=f"{flare_class}{intensity:.1f}",
-                                peak_time=timestamp,
-                                intensity=intensity
-                            )
-                            flares.append(flare)
-                
-                except (ValueError, KeyError) as e:
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+                if np.isnat(timestamp):
                     continue
+                time_values.append(timestamp)
+                flux_values.append(flux)
+            
+            if not time_values:
+                return []
+            
+            times = np.array(time_values, dtype='datetime64[s]')
+            fluxes = np.array(flux_values, dtype=np.float64)
+            classes = np.digitize(fluxes, _FLUX_BINS)
+            
+            # End points count as peaks, interior points must not be below either neighbour
+            is_peak = np.ones(len(fluxes), dtype=bool)
+            is_peak[1:-1] = (fluxes[1:-1] >= fluxes[:-2]) & (fluxes[1:-1] >= fluxes[2:])
+            
+            # Class index 2 and above is B or stronger
+            candidates = np.flatnonzero(is_peak & (classes >= 2) & (times >= cutoff))
+            
+            flares = []
+            for i in candidates:
+                timestamp = times[i].astype(datetime).replace(tzinfo=timezone.utc)
+                intensity = float(fluxes[i]) * 1e6  # Convert to micro-watts per square meter
+                
+                flares.append(SolarFlare(
+                    timestamp=timestamp,
+                    flare_class=f"{_FLUX_CLASSES[classes[i]]}{intensity:.1f}",
+                    peak_time=timestamp,
+                    intensity=intensity
+                ))
             
             filtered_flares = self._filter_duplicate_flares(flares)
             
@@ -284,18 +412,7 @@ class SpaceWeatherAPI:
     
     def _classify_xray_flux(self, flux: float) -> Optional[str]:
         """Classify X-ray flux into flare classes"""
-        if flux >= 1e-4:
-            return "X"
-        elif flux >= 1e-5:
-            return "M"
-        elif flux >= 1e-6:
-            return "C"
-        elif flux >= 1e-7:
-            return "B"
-        elif flux >= 1e-8:
-            return "A"
-        else:
-            return None
+        return _FLUX_CLASSES[bisect.bisect_right(_FLUX_BINS, flux)]
     
     def _filter_duplicate_flares(self, flares: List[SolarFlare], window_minutes: int = 30) -> List[SolarFlare]:
         """Filter out duplicate flares within a time window"""
@@ -305,18 +422,12 @@ class SpaceWeatherAPI:
         filtered = []
         window = timedelta(minutes=window_minutes)
         
+        # Input is sorted by time, so only the last kept flare can be within the window
         for flare in sorted(flares, key=lambda x: x.timestamp):
-            is_duplicate = False
-            
-            for existing in filtered:
-                if abs(flare.timestamp - existing.timestamp) < window:
-                    if flare.intensity > existing.intensity:
-                        filtered.remove(existing)
-                        filtered.append(flare)
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
+            if filtered and flare.timestamp - filtered[-1].timestamp < window:
+                if flare.intensity > filtered[-1].intensity:
+                    filtered[-1] = flare
+            else:
                 filtered.append(flare)
         
         return filtered
@@ -325,25 +436,19 @@ class SpaceWeatherAPI:
         """Get current geomagnetic conditions"""
         try:
             possible_endpoints = [
-                "planetary_k_index. json",
+                "planetary_k_index.json",
                 "kp_index.json", 
-                "planetary_k_index_1m. json"
+                "planetary_k_index_1m.json"
             ]
             
-            data = None
-            for endpoint in possible_endpoints:
-                url = f"{self.noaa_base_url}{endpoint}"
-                test_data = await self._fetch_json(url)
-                if test_data:
-                    data = test_data
-                    break
+            data = await self._fetch_first(possible_endpoints)
             
             if not data:
                 self.logger.warning("No Kp index data available from NOAA")
                 return None
             
             latest = data[-1]
-            timestamp = datetime.fromisoformat(latest["time_tag"].replace('Z', '+00:00'))
+            timestamp = _parse_iso(latest["time_tag"])
             kp_index = float(latest. get("kp_index", 0))
             
             activity_level = self._get_activity_level(kp_index)
@@ -360,22 +465,7 @@ class SpaceWeatherAPI:
     
     def _get_activity_level(self, kp_index: float) -> str:
         """Get geomagnetic activity level from Kp index"""
-        if kp_index >= 9:
-            return "Extreme Storm"
-        elif kp_index >= 8:
-            return "Severe Storm"
-        elif kp_index >= 7:
-            return "Strong Storm"
-        elif kp_index >= 6:
-            return "Moderate Storm"
-        elif kp_index >= 5:
-            return "Minor Storm"
-        elif kp_index >= 4:
-            return "Active"
-        elif kp_index >= 3:
-            return "Unsettled"
-        else:
-            return "Quiet"
+        return _KP_LEVELS[bisect.bisect_right(_KP_BINS, kp_index)]
     
     async def get_solar_wind_data(self) -> Optional[SolarWindData]:
         """Get current solar wind parameters"""
@@ -383,15 +473,13 @@ class SpaceWeatherAPI:
             wind_endpoints = [
                 ("solar_wind_speed.json", "speed"),
                 ("solar_wind_mag_field.json", "magnetic"),
-                ("solar_wind_plasma. json", "plasma")
+                ("solar_wind_plasma.json", "plasma")
             ]
             
             wind_data = {}
+            results = await self._fetch_all([endpoint for endpoint, _ in wind_endpoints])
             
-            for endpoint, data_type in wind_endpoints:
-                url = f"{self.noaa_base_url}{endpoint}"
-                data = await self._fetch_json(url)
-                
+            for (endpoint, data_type), data in zip(wind_endpoints, results):
                 if data and len(data) > 0:
                     latest = data[-1]
                     
@@ -409,7 +497,7 @@ class SpaceWeatherAPI:
                         wind_data["temperature"] = float(latest.get("temperature", 0))
             
             if "timestamp" in wind_data:
-                timestamp = datetime.fromisoformat(wind_data["timestamp"].replace('Z', '+00:00'))
+                timestamp = _parse_iso(wind_data["timestamp"])
                 
                 return SolarWindData(
                     timestamp=timestamp,
@@ -427,53 +515,109 @@ class SpaceWeatherAPI:
             log_exception(e, "Getting solar wind data")
             return None
     
+    async def _fetch_all(self, endpoints: List[str]) -> List[Optional[Any]]:
+        """Fetch several NOAA endpoints concurrently, in the given order"""
+        results = await asyncio.gather(
+            *(self._fetch_json(f"{self.noaa_base_url}{endpoint}") for endpoint in endpoints),
+            return_exceptions=True
+        )
+        return [None if isinstance(result, BaseException) else result for result in results]
+    
+    async def _fetch_first(self, endpoints: List[str]) -> Optional[Any]:
+        """Fetch alternative NOAA endpoints concurrently and keep the first one with data"""
+        for data in await self._fetch_all(endpoints):
+            if data:
+                return data
+        return None
+    
+    def _cache_ttl(self, url: str) -> int:
+        """Get the cache lifetime for a URL from CACHE_POLICY"""
+        for pattern, ttl in CACHE_POLICY.items():
+            if pattern in url:
+                return ttl
+        return self._cache_timeout
+    
+    def _cache_store(self, url: str, data: Any):
+        """Cache a response with fresh and stale deadlines"""
+        fresh_until = time.monotonic() + self._cache_ttl(url)
+        stale_until = fresh_until + self._cache_stale_timeout
+        
+        with self._cache_lock:
+            self._cache.pop(url, None)
+            if len(self._cache) >= self._cache_max_entries:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[url] = (fresh_until, stale_until, data)
+    
+    def _cache_fresh(self, url: str) -> Optional[Any]:
+        """Get a cache entry that has not expired yet"""
+        with self._cache_lock:
+            entry = self._cache.get(url)
+        if entry and time.monotonic() < entry[0]:
+            return entry[2]
+        return None
+    
+    def _cache_stale(self, url: str) -> Optional[Any]:
+        """Get an expired cache entry that is still inside its stale window"""
+        with self._cache_lock:
+            entry = self._cache.get(url)
+        if entry and time.monotonic() < entry[1]:
+            self.logger.warning(f"Serving stale cached data for {url}")
+            return entry[2]
+        return None
+    
     async def _fetch_json(self, url: str) -> Optional[Dict]:
         """Fetch JSON data from URL with caching"""
-        cache_key = f"json_{url}"
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if datetime.utcnow() - cached_time < timedelta(seconds=self._cache_timeout):
-                return cached_data
+        cached = self._cache_fresh(url)
+        if cached is not None:
+            return cached
         
+        # Helpers fetching the same endpoint at once share one request
+        pending = self._inflight.get(url)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            data = await self._request_json(url)
+            future.set_result(data)
+            return data
+        finally:
+            del self._inflight[url]
+            if not future.done():
+                future.cancel()
+    
+    async def _request_json(self, url: str) -> Optional[Dict]:
+        """Request JSON data from URL, falling back to stale cache on failure"""
         try:
             if not self._session:
                 raise Exception("No active session")
             
             async with self._session.get(url) as response:
                 if response. status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=_json_loads)
                     
                     # Cache the result
-                    self._cache[cache_key] = (datetime.utcnow(), data)
+                    self._cache_store(url, data)
                     
                     return data
                 else:
                     self.logger.warning(f"HTTP {response.status} for {url}")
-                    return None
+                    return self._cache_stale(url)
                     
         except Exception as e:
             log_exception(e, f"Fetching JSON from {url}")
-            return None
+            return self._cache_stale(url)
     
     async def _fetch_html(self, url: str) -> Optional[str]:
-        """Fetch HTML content from URL with caching"""
-        cache_key = f"html_{url}"
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if datetime.utcnow() - cached_time < timedelta(seconds=self._cache_timeout):
-                return cached_data
-        
+        """Fetch HTML content from URL"""
         try:
             if not self._session:
                 raise Exception("No active session")
             
             async with self._session.get(url) as response:
                 if response.status == 200:
-                    text = await response.text()
-                    
-                    self._cache[cache_key] = (datetime.utcnow(), text)
-                    
-                    return text
+                    return await response.text()
                 else:
                     self.logger.warning(f"HTTP {response.status} for {url}")
                     return None
@@ -482,16 +626,26 @@ class SpaceWeatherAPI:
             log_exception(e, f"Fetching HTML from {url}")
             return None
 
-def get_space_weather_sync(config_manager: ConfigManager) -> SpaceWeatherSummary:
+atexit.register(SpaceWeatherAPI.close_shared_session)
+
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop that serves sync callers, starting it on first use"""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            _bg_loop = asyncio.new_event_loop()
+            threading.Thread(target=_bg_loop.run_forever, name="SpaceWeatherLoop", daemon=True).start()
+        return _bg_loop
+
+def get_space_weather_sync(config_manager: ConfigManager, timeout: float = 60.0) -> SpaceWeatherSummary:
     """Get space weather data synchronously"""
     async def _get_data():
         async with SpaceWeatherAPI(config_manager) as api:
             return await api.get_current_conditions()
     
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(_get_data())
\ No newline at end of file
+    # One long-lived loop keeps the shared session and its connections alive between calls
+    future = asyncio.run_coroutine_threadsafe(_get_data(), _get_background_loop())
+    return future.result(timeout=timeout)
@@ -3,9 +3,67 @@ Audio Manager - Handle audio device detection and configuration
 """
 import pyaudio
 import numpy as np
+import threading
 from typing import List, Dict, Optional
 from core.logger import get_logger
 
+class AudioRingBuffer:
+    """Single-producer/single-consumer ring buffer of audio samples
+    
+    The PortAudio callback only copies samples in; processing happens on the
+    consumer side so the real-time thread never runs the DSP pipeline.
+    """
+    
+    def __init__(self, capacity: int, dtype=np.int16):
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._write_pos = 0
+        self._read_pos = 0
+        self._data_ready = threading.Event()
+        self.overruns = 0
+        
+    def write(self, samples: np.ndarray):
+        """Append samples - called from the audio thread only"""
+        n = len(samples)
+        if n > self.capacity:
+            samples = samples[-self.capacity:]
+            n = self.capacity
+        
+        start = self._write_pos % self.capacity
+        first = min(n, self.capacity - start)
+        self._buffer[start:start + first] = samples[:first]
+        self._buffer[:n - first] = samples[first:]
+        
+        self._write_pos += n
+        self._data_ready.set()
+        
+    def available(self) -> int:
+        """Number of samples waiting to be read"""
+        return self._write_pos - self._read_pos
+        
+    def read(self, count: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Read exactly count samples, or None if they did not arrive within timeout"""
+        while self.available() < count:
+            self._data_ready.clear()
+            if self.available() >= count:
+                break
+            if not self._data_ready.wait(timeout):
+                return None
+        
+        # The writer lapped us: skip ahead to the oldest samples still in the ring
+        if self.available() > self.capacity:
+            self._read_pos = self._write_pos - self.capacity
+            self.overruns += 1
+        
+        start = self._read_pos % self.capacity
+        first = min(count, self.capacity - start)
+        block = np.empty(count, dtype=self._buffer.dtype)
+        block[:first] = self._buffer[start:start + first]
+        block[first:] = self._buffer[:count - first]
+        
+        self._read_pos += count
+        return block
+
 class AudioManager: 
     """Manages audio input devices and streaming"""
     
@@ -5,8 +5,10 @@ Handles all application settings with validation and automatic updates
 
 import json
 import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -117,6 +119,8 @@ class ConfigManager:
     
     def __init__(self, config_file: str = "config/default_config.json"):
         self. config_file = Path(config_file)
+        self._flat: Dict[str, Any] = {}
+        self._dirty = False
         self.config: Dict[str, Any] = {}
         self.logger = get_logger(__name__)
         
@@ -128,6 +132,26 @@ class ConfigManager:
         self. load_config()
         self._original_config = copy.deepcopy(self.config)
     
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Nested configuration dict; edit through set() or reassign it whole"""
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._flat = dict(self._flatten(value))
+        self._dirty = True
+    
+    @staticmethod
+    def _flatten(tree: Dict[str, Any], prefix: str = ''):
+        """Yield (dotted key, value) for every node of a nested dict, sections included"""
+        for k, v in tree.items():
+            key = f"{prefix}{k}"
+            yield key, v
+            if isinstance(v, dict):
+                yield from ConfigManager._flatten(v, key + '.')
+    
     def load_config(self) -> bool:
         """Load configuration from file with error handling"""
         try:
@@ -137,6 +161,7 @@ class ConfigManager:
                 
                 self. logger.info(f"Configuration loaded from {self.config_file}")
                 
+                self._dirty = False
                 self._validate_and_upgrade()
                 return True
             else:
@@ -160,6 +185,9 @@ class ConfigManager:
         if self._saving:
             return False
         
+        if not self._dirty and not self.has_changes():
+            return True
+        
         self._saving = True
         
         try:
@@ -169,15 +197,29 @@ class ConfigManager:
                 backup_file = self.config_file.with_suffix('.bak')
                 backup_file.write_bytes(self.config_file.read_bytes())
             
-            if 'application' not in self.config:
-                self.config['application'] = {}
-            self.config['application']['last_updated'] = datetime.now().isoformat()
+            application = self.config.setdefault('application', {})
+            application['last_updated'] = datetime.now().isoformat()
+            self._flat['application'] = application
+            self._flat['application.last_updated'] = application['last_updated']
             
-            with open(self. config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            # Write to a sibling temp file and swap it in so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_file.parent, prefix=self.config_file.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self._dump_config())
+                    f.flush()
+                    os.fsync(f.fileno())
+                # mkstemp creates the file 0600; keep the permissions a plain write would leave
+                os.chmod(tmp_path, self._config_file_mode())
+                os.replace(tmp_path, self.config_file)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
             
             self.logger.info(f"Configuration saved to {self.config_file}")
             self._original_config = copy.deepcopy(self.config)
+            self._dirty = False
             return True
             
         except Exception as e:
@@ -187,6 +229,19 @@ class ConfigManager:
         finally:
             self._saving = False
     
+    def _config_file_mode(self) -> int:
+        """Permission bits for the saved config: the current file's, or the umask default for a new one"""
+        try:
+            return stat.S_IMODE(os.stat(self.config_file).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+    
+    def _dump_config(self) -> bytes:
+        """Serialize the configuration in the 4-space layout users hand-edit"""
+        return json.dumps(self.config, indent=4, ensure_ascii=False).encode('utf-8')
+    
     def create_default_config(self) -> None:
         """Create comprehensive default configuration"""
         self.config = {
@@ -281,6 +336,10 @@ class ConfigManager:
             },
             
             "display": asdict(DisplayConfig()),
+            "rendering": {
+                "opengl": True,
+                "chart_backend": "qtcharts"
+            },
             "alerts": asdict(AlertConfig())
         }
         
@@ -288,33 +347,51 @@ class ConfigManager:
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot-notation key"""
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any, auto_save: bool = None) -> None:
         """Set configuration value by dot-notation key - FIXED TO PREVENT RECURSION"""
         keys = key.split('.')
         config = self.config
         
-        for k in keys[:-1]:
+        for i, k in enumerate(keys[:-1]):
             if k not in config:
                 config[k] = {}
+                self._flat['.'.join(keys[:i + 1])] = config[k]
             config = config[k]
         
         config[keys[-1]] = value
         
+        # Parents are the same dict objects; only this key's subtree changed
+        for stale in [k for k in self._flat if k.startswith(key + '.')]:
+            del self._flat[stale]
+        self._flat[key] = value
+        if isinstance(value, dict):
+            self._flat.update(self._flatten(value, key + '.'))
+        self._dirty = True
+        
         should_auto_save = auto_save if auto_save is not None else self._auto_save
         if should_auto_save and not self._saving and self.has_changes():
             self.save_config(backup=False)
     
+    @property
+    def first_run_marker(self) -> Path:
+        """Empty file next to the config recording that first-run setup was handled"""
+        return self.config_file.parent / ".first_run_done"
+    
+    def is_first_run(self) -> bool:
+        """True until first-run setup is done; configs saying first_run=false count as done"""
+        return (not self.first_run_marker.exists()
+                and bool(self.get('application.first_run', True)))
+    
+    def mark_first_run_done(self) -> None:
+        """Record first-run completion so neither the GUI nor the web UI asks again"""
+        try:
+            self.first_run_marker.parent.mkdir(parents=True, exist_ok=True)
+            self.first_run_marker.touch()
+        except OSError as e:
+            self.logger.warning(f"Could not record first run completion: {e}")
+    
     def has_changes(self) -> bool:
         """Check if configuration has unsaved changes"""
         return self. config != self._original_config
@@ -336,7 +413,7 @@ class ConfigManager:
     
     def get_vlf_stations(self) -> List[VLFStation]:
         """Get VLF stations configuration"""
-        stations_data = self.get('vlf_stations. default_stations', [])
+        stations_data = self.get('vlf_stations.default_stations', [])
         return [VLFStation(**station) for station in stations_data]
     
     def add_vlf_station(self, station: VLFStation) -> bool:
@@ -358,6 +435,30 @@ class ConfigManager:
             log_exception(e, f"Adding VLF station {station.code}")
             return False
     
+    def extend_vlf_stations(self, stations: Iterable[VLFStation]) -> int:
+        """Add several VLF stations with a single config update"""
+        try:
+            existing = self.get('vlf_stations.default_stations', [])
+            known_codes = {s.get('code') for s in existing}
+            
+            added = []
+            for station in stations:
+                if station.code in known_codes:
+                    self.logger.warning(f"Station {station.code} already exists")
+                    continue
+                known_codes.add(station.code)
+                added.append(asdict(station))
+            
+            if added:
+                self.set('vlf_stations.default_stations', existing + added)
+                self.logger.info(f"Added {len(added)} VLF stations")
+            
+            return len(added)
+            
+        except Exception as e:
+            log_exception(e, "Adding VLF stations")
+            return 0
+    
     def remove_vlf_station(self, station_code: str) -> bool:
         """Remove VLF station from configuration"""
         try:
@@ -387,7 +488,7 @@ class ConfigManager:
     
     def update_data_source(self, source_name: str, last_update: datetime) -> None:
         """Update data source last update timestamp"""
-        self.set(f'data_sources.{source_name}. last_update', last_update. isoformat())
+        self.set(f'data_sources.{source_name}.last_update', last_update. isoformat())
     
     def _validate_and_upgrade(self) -> None:
         """Validate and upgrade configuration structure"""
@@ -397,6 +498,8 @@ class ConfigManager:
         for section in required_sections:
             if section not in self.config:
                 self. config[section] = {}
+                self._flat[section] = self.config[section]
+                self._dirty = True
                 self._validation_errors.append(f"Missing section: {section}")
         
         obs = self.config. get('observatory', {})
@@ -408,7 +511,7 @@ class ConfigManager:
         if not (-180 <= lon <= 180):
             self._validation_errors.append(f"Invalid longitude: {lon}")
         
-        stations = self.get('vlf_stations. default_stations', [])
+        stations = self.get('vlf_stations.default_stations', [])
         for i, station in enumerate(stations):
             if not isinstance(station, dict):
                 continue
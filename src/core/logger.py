@@ -3,9 +3,11 @@ Advanced logging system for SuperSID Pro
 Provides comprehensive logging with rotation, colors, and multiple outputs
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -51,6 +53,8 @@ class SuperSIDLogger:
         self.data_logger = logging.getLogger(f"{name}.Data")
         self.error_logger = logging.getLogger(f"{name}.Error")
         
+        self._listeners = []
+        
         if not self. logger.handlers:
             self. setup_handlers()
     
@@ -80,7 +84,6 @@ class SuperSIDLogger:
             '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
         )
         main_handler.setFormatter(main_formatter)
-        self.logger.addHandler(main_handler)
         
         error_handler = logging.handlers.RotatingFileHandler(
             log_dir / "supersid_pro_errors.log",
@@ -90,7 +93,7 @@ class SuperSIDLogger:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(main_formatter)
-        self.logger.addHandler(error_handler)
+        self._add_queued_handlers(self.logger, main_handler, error_handler)
         
         perf_handler = logging.handlers.RotatingFileHandler(
             log_dir / "performance.log",
@@ -102,7 +105,7 @@ class SuperSIDLogger:
             '%(asctime)s - PERF - %(message)s'
         )
         perf_handler.setFormatter(perf_formatter)
-        self.performance_logger.addHandler(perf_handler)
+        self._add_queued_handlers(self.performance_logger, perf_handler)
         self.performance_logger.setLevel(logging.INFO)
         
         data_handler = logging.handlers.RotatingFileHandler(
@@ -115,9 +118,19 @@ class SuperSIDLogger:
             '%(asctime)s - DATA - %(levelname)s - %(message)s'
         )
         data_handler.setFormatter(data_formatter)
-        self.data_logger.addHandler(data_handler)
+        self._add_queued_handlers(self.data_logger, data_handler)
         self.data_logger. setLevel(logging.INFO)
     
+    def _add_queued_handlers(self, logger: logging.Logger, *handlers: logging.Handler):
+        """Attach file handlers behind a queue so callers never block on disk I/O"""
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        self._listeners.append(listener)
+        atexit.register(listener.stop)
+    
     def log_exception(self, exception: Exception, context: str = ""):
         """Log exception with full traceback"""
         error_msg = f"Exception in {context}: {str(exception)}"
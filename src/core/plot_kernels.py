@@ -0,0 +1,144 @@
+"""
+Numeric kernels for chart rendering
+Compiled with numba when it is installed; explicit signatures make numba
+compile (or load from its cache) at import, so the first plot does not wait
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit("int64[:](int64[:], float32[:], int64)", cache=True)
+def m4_indices(x, y, width_px):
+    """Indices of the first, min, max and last sample of each pixel column
+
+    `x` must be sorted. Returns every index when there are no more than
+    four samples per pixel, so callers can always index with the result.
+    """
+    n = x.shape[0]
+    if width_px <= 0 or n <= 4 * width_px:
+        return np.arange(n)
+    x0 = x[0]
+    span = x[n - 1] - x0
+    if span <= 0:
+        return np.arange(n)
+
+    first = np.full(width_px, -1, dtype=np.int64)
+    last = np.empty(width_px, dtype=np.int64)
+    lo = np.empty(width_px, dtype=np.int64)
+    hi = np.empty(width_px, dtype=np.int64)
+    for i in range(n):
+        b = int((x[i] - x0) / span * width_px)
+        if b >= width_px:
+            b = width_px - 1
+        if first[b] < 0:
+            first[b] = i
+            lo[b] = i
+            hi[b] = i
+        else:
+            if y[i] < y[lo[b]]:
+                lo[b] = i
+            if y[i] > y[hi[b]]:
+                hi[b] = i
+        last[b] = i
+
+    # Samples of a column are contiguous, so first <= min/max <= last
+    out = np.empty(4 * width_px, dtype=np.int64)
+    m = 0
+    for b in range(width_px):
+        if first[b] < 0:
+            continue
+        p = min(lo[b], hi[b])
+        q = max(lo[b], hi[b])
+        prev = first[b]
+        out[m] = prev
+        m += 1
+        for idx in (p, q, last[b]):
+            if idx > prev:
+                out[m] = idx
+                m += 1
+                prev = idx
+    return out[:m]
+
+@njit("float64[:,:](int64[:], float32[:], int64)", cache=True, fastmath=True)
+def lttb(ts: np.ndarray, amp: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling to `n_out` (time, amplitude) rows
+
+    Keeps the first and last sample and, from each bucket in between, the one
+    forming the largest triangle with the previous pick and the next bucket's mean.
+    """
+    n = ts.shape[0]
+    if n_out >= n or n_out < 3:
+        out = np.empty((n, 2))
+        out[:, 0] = ts
+        out[:, 1] = amp
+        return out
+
+    out = np.empty((n_out, 2))
+    every = (n - 2) / (n_out - 2)
+    out[0, 0] = ts[0]
+    out[0, 1] = amp[0]
+    a = 0
+
+    for i in range(n_out - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += ts[j]
+            avg_y += amp[j]
+        count = avg_end - avg_start
+        avg_x /= count
+        avg_y /= count
+
+        ax = float(ts[a])
+        ay = float(amp[a])
+        max_area = -1.0
+        next_a = int(i * every) + 1
+        for j in range(next_a, int((i + 1) * every) + 1):
+            area = abs((ax - avg_x) * (amp[j] - ay) - (ax - ts[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        out[i + 1, 0] = ts[next_a]
+        out[i + 1, 1] = amp[next_a]
+        a = next_a
+
+    out[n_out - 1, 0] = ts[n - 1]
+    out[n_out - 1, 1] = amp[n - 1]
+    return out
+
+def downsample_m4(x: np.ndarray, y: np.ndarray, width_px: int):
+    """Reduce a sorted trace to at most four points per pixel column"""
+    idx = m4_indices(x, y, int(width_px))
+    return x[idx], y[idx]
+
+_WARMED = False
+
+def warmup():
+    """Run each kernel once on dummy data so later calls take the compiled path"""
+    global _WARMED
+    if _WARMED or not NUMBA_AVAILABLE:
+        return
+    ts = np.arange(64, dtype=np.int64)
+    amp = np.zeros(64, dtype=np.float32)
+    lttb(ts, amp, 16)
+    m4_indices(ts, amp, 4)
+    _WARMED = True
+
+try:
+    warmup()
+except Exception:
+    # Warming up is only an optimization and must never break the import
+    pass
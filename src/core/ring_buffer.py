@@ -0,0 +1,68 @@
+"""
+Append-only sample buffer for real-time plots
+Keeps the visible window contiguous so views can go straight to setData
+"""
+import numpy as np
+
+class RingBuffer:
+    """Preallocated buffer holding the last `window` samples of each channel
+
+    Storage is `headroom` times the window, one contiguous row per channel.
+    Appends write in place at the write index; when the storage fills up the
+    last `window` samples are moved back to the start, so compaction happens
+    once every (headroom-1)*window samples and `view()` never copies.
+    """
+
+    def __init__(self, window: int, channels: int = 1, dtype=np.float64, headroom: int = 4):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.channels = channels
+        self._data = np.empty((channels, window * max(headroom, 2)), dtype=dtype)
+        self._w = 0
+
+    def __len__(self) -> int:
+        return min(self._w, self.window)
+
+    @property
+    def capacity(self) -> int:
+        return self._data.shape[1]
+
+    def append(self, values):
+        """Append one sample (a scalar, or one value per channel)"""
+        if self._w == self.capacity:
+            self._compact()
+        self._data[:, self._w] = values
+        self._w += 1
+
+    def extend(self, block):
+        """Append a block of samples, shape (frames, channels)"""
+        if block.ndim == 1:
+            block = block[:, None]
+        block = block[-self.window:]
+        n = block.shape[0]
+        if self._w + n > self.capacity:
+            self._compact()
+        np.copyto(self._data[:, self._w:self._w + n], block.T, casting='same_kind')
+        self._w += n
+
+    def _compact(self):
+        """Move the visible window to the start of the storage"""
+        start = self._w - self.window
+        if start > 0:
+            self._data[:, :self.window] = self._data[:, start:self._w]
+            self._w = self.window
+
+    def view(self, channel: int = None) -> np.ndarray:
+        """View of the visible window, without copying"""
+        start = max(self._w - self.window, 0)
+        if channel is None:
+            return self._data[:, start:self._w]
+        return self._data[channel, start:self._w]
+
+    def last(self, channel: int = 0):
+        """Most recent value of a channel, or None when empty"""
+        return self._data[channel, self._w - 1] if self._w else None
+
+    def clear(self):
+        self._w = 0
@@ -0,0 +1,32 @@
+"""
+Numeric kernels for the VLF signal simulator
+Compiled with numba when it is installed
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def fill_signals(t, base_freqs, base_amps, harmonics, noise, freq_out, amp_out):
+    """Fill per-station frequency and amplitude for time t into the output arrays"""
+    for i in range(base_freqs.shape[0]):
+        k = harmonics[i]
+        freq_out[i] = base_freqs[i] + 0.05 * np.sin(t * 0.05 * k)
+        amp_out[i] = abs(base_amps[i] + 0.0005 * np.sin(t * 0.1 * k) + 0.0001 * noise[i])
+
+def warmup():
+    """Trigger JIT compilation so the first real tick does not pay for it"""
+    if not NUMBA_AVAILABLE:
+        return
+    ones = np.ones(1, dtype=np.float64)
+    fill_signals(0.0, ones, ones, ones, ones, np.empty(1), np.empty(1))
@@ -45,6 +45,10 @@ class VLFAudioProcessor:
         self._cached_windows = {}
         self._cached_freq_bins = {}
         
+        # Reused across buffers: one VLFSignal per station, updated in place
+        self._signal_pool: Dict[str, VLFSignal] = {}
+        self._signal_buffer: Dict[str, VLFSignal] = {}
+        
         self.baselines = {}
         self.baseline_samples = 300
         self.baseline_history = {station: [] for station in self.stations}
@@ -86,7 +90,11 @@ class VLFAudioProcessor:
         return self._cached_windows[buffer_size], self._cached_freq_bins[buffer_size]
     
     def process_audio_buffer(self, audio_data: np.ndarray) -> Dict[str, VLFSignal]:  
-        """Process audio buffer and extract VLF station data"""
+        """Process audio buffer and extract VLF station data
+        
+        The returned dict and its VLFSignal objects are reused, so they are only
+        valid until the next call.
+        """
         try:
             if audio_data is None or len(audio_data) == 0:
                 return {}
@@ -113,7 +121,8 @@ class VLFAudioProcessor:
                 self. logger.warning("Power spectrum contains invalid values")
                 power_spectrum = np.nan_to_num(power_spectrum, nan=0.0, posinf=0.0, neginf=0.0)
             
-            vlf_signals = {}
+            vlf_signals = self._signal_buffer
+            vlf_signals.clear()
             current_time = time.time()
             
             for i, station in enumerate(self.stations):
@@ -144,13 +153,20 @@ class VLFAudioProcessor:
                     amplitude = max(0.0, min(amplitude, 1.0))
                     
                     band_id = station
-                    signal_obj = VLFSignal(
-                        timestamp=current_time,
-                        frequency=actual_freq,
-                        amplitude=amplitude,
-                        phase=0.0,
-                        station_id=band_id
-                    )
+                    signal_obj = self._signal_pool.get(band_id)
+                    if signal_obj is None:
+                        signal_obj = VLFSignal(
+                            timestamp=current_time,
+                            frequency=actual_freq,
+                            amplitude=amplitude,
+                            phase=0.0,
+                            station_id=band_id
+                        )
+                        self._signal_pool[band_id] = signal_obj
+                    else:
+                        signal_obj.timestamp = current_time
+                        signal_obj.frequency = actual_freq
+                        signal_obj.amplitude = amplitude
                     
                     vlf_signals[band_id] = signal_obj
                     
@@ -11,6 +11,8 @@ import time
 @dataclass
 class VLFSignal:
     """VLF signal data structure"""
+    __slots__ = ('timestamp', 'frequency', 'amplitude', 'phase', 'station_id')
+    
     timestamp: float
     frequency: float
     amplitude: float
@@ -26,15 +26,43 @@ class RealtimeStorage:
         self.logger = get_logger(__name__)
         self._lock = threading.Lock()
         
+        # One connection per worker thread, reused across calls
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        
         # Ensure data directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize database
         self._init_database()
         
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the calling thread's pooled database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+        
+    def close(self):
+        """Close all pooled connections"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+        
     def _init_database(self):
         """Initialize the real-time database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS vlf_measurements (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -59,7 +87,7 @@ class RealtimeStorage:
         """Store a single VLF measurement"""
         with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._get_connection() as conn:
                     conn.execute("""
                         INSERT INTO vlf_measurements 
                         (timestamp, station_id, frequency, amplitude, phase)
@@ -79,7 +107,7 @@ class RealtimeStorage:
         """Store multiple measurements efficiently"""
         with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._get_connection() as conn:
                     data = [
                         (m.timestamp, m.station_id, m.frequency, m.amplitude, m.phase)
                         for m in measurements
@@ -99,9 +127,7 @@ class RealtimeStorage:
     def get_recent_data(self, station_id: str, minutes: int = 60) -> List[VLFMeasurement]:
         """Get recent measurements for a station"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
+            with self._get_connection() as conn:
                 cursor = conn.execute("""
                     SELECT timestamp, station_id, frequency, amplitude, phase
                     FROM vlf_measurements
@@ -129,7 +155,7 @@ class RealtimeStorage:
     def cleanup_old_data(self, days_to_keep: int = 30):
         """Clean up old measurements to manage database size"""
         try:
-            with sqlite3.connect(self. db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.execute("""
                     DELETE FROM vlf_measurements
                     WHERE timestamp < datetime('now', '-{} days')
@@ -3,6 +3,8 @@ Main application window for SuperSID Pro - UPDATED with Charts
 Modern PyQt6 interface with dark theme and professional styling
 """
 
+import importlib
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -11,60 +13,145 @@ from PyQt6.QtWidgets import (
     QTabWidget, QStatusBar, QMenuBar, QToolBar, QPushButton,
     QLabel, QFrame, QSplitter, QSystemTrayIcon, QMenu, QMessageBox
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QTimer, QThread, QObject, QElapsedTimer, pyqtSignal, QSize, QDateTime
 from PyQt6.QtGui import QIcon, QPixmap, QAction, QFont, QPalette, QColor
 
-from gui.widgets.observatory_widget import ObservatoryWidget
-from gui.widgets.monitoring_widget import MonitoringWidget
-from gui.widgets.stations_widget import StationsWidget
-from gui.widgets.space_weather_widget import SpaceWeatherWidget
-from gui.widgets.vlf_database_widget import VLFDatabaseWidget
-from gui.widgets. chart_widget import ChartWidget
-from gui.dialogs.setup_dialog import SetupDialog
 from gui.styles.dark_theme import DarkTheme
 from core.config_manager import ConfigManager
 from core.logger import get_logger
 from gui.widgets.realtime_vlf_widget import RealtimeVLFWidget
 from core.vlf_gui_integration import VLFGUIIntegration
 
+class DataCollector(QThread):
+    """Reads sound card blocks off the GUI thread"""
+    
+    data_ready = pyqtSignal(object)  # np.ndarray of shape (frames, channels)
+    
+    def __init__(self, config_manager: ConfigManager, parent=None):
+        super().__init__(parent)
+        self.logger = get_logger(__name__)
+        self.sample_rate = int(config_manager.get('sampling.sample_rate', 48000))
+        self.block_size = int(config_manager.get('sampling.buffer_size', 1024))
+        self.channels = int(config_manager.get('sampling.channels', 1))
+        device = config_manager.get('sampling.audio_device', 'default')
+        self.device = None if device in (None, '', 'default') else device
+    
+    def run(self):
+        """Blocking read loop, runs until interruption is requested"""
+        try:
+            import sounddevice as sd
+            
+            with sd.InputStream(samplerate=self.sample_rate, blocksize=self.block_size,
+                                channels=self.channels, device=self.device,
+                                dtype='float32') as stream:
+                while not self.isInterruptionRequested():
+                    block, overflowed = stream.read(self.block_size)
+                    if overflowed:
+                        self.logger.debug("Input overflow in data collection")
+                    self.data_ready.emit(block)
+        except Exception as e:
+            self.logger.error(f"Data collection stopped: {e}")
+
+class TickScheduler(QObject):
+    """Runs periodic callbacks from one shared 33 ms timer"""
+    
+    def __init__(self, parent: Optional[QObject] = None, interval_ms: int = 33):
+        super().__init__(parent)
+        self._entries = []  # [period_ms, last_fire_ms, callback]
+        self._slack = interval_ms // 2
+        
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._tick)
+    
+    def every(self, period_ms: int, callback):
+        """Call `callback` roughly every `period_ms` milliseconds"""
+        self._entries.append([period_ms, self._clock.elapsed(), callback])
+    
+    def _tick(self):
+        now = self._clock.elapsed()
+        for entry in self._entries:
+            # Timer jitter must not push a 33 ms callback to every other tick
+            if now - entry[1] >= entry[0] - self._slack:
+                entry[1] = now
+                entry[2]()
+    
+    def resume(self):
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def pause(self):
+        self._timer.stop()
+
 class SuperSIDProApp(QApplication):
     """Main application class"""
     
     def __init__(self, config_manager: ConfigManager, debug: bool = False):
         super().__init__(sys.argv)
         
+        # Always set; built on first use, see _ensure_tray
+        self.tray_icon: Optional[QSystemTrayIcon] = None
+        self.tray_menu: Optional[QMenu] = None
+        
         self.config_manager = config_manager
         self.debug = debug
         self.logger = get_logger(__name__)
         
+        self._first_run = config_manager.is_first_run()
+        
+        # pyqtgraph reads its config options when plots are created
+        if config_manager.get('rendering.opengl', True):
+            self.enable_opengl_plots()
+        
         self.setApplicationName("SuperSID Pro")
         self.setApplicationVersion("1.0.0")
         self.setOrganizationName("Observatory Software Solutions")
         
         self.apply_theme()
         
-        self.main_window = MainWindow(config_manager)
+        # Decoded once; windows without their own icon inherit it from the application
+        icon_path = Path("assets/icons/supersid_icon.png")
+        self.app_icon = QIcon(str(icon_path)) if icon_path.exists() else QIcon()
+        self.setWindowIcon(self.app_icon)
+        
+        self.main_window = MainWindow(config_manager, app=self)
         
-        self.setup_system_tray()
+        self.aboutToQuit.connect(self._hide_tray)
         
         self.logger.info("SuperSID Pro application initialized")
     
+    def enable_opengl_plots(self):
+        """Let pyqtgraph rasterize curves on the GPU when PyOpenGL is available"""
+        try:
+            import OpenGL  # noqa: F401
+            import pyqtgraph as pg
+            pg.setConfigOption('useOpenGL', True)
+            pg.setConfigOption('enableExperimental', True)
+            pg.setConfigOption('antialias', False)
+        except Exception as e:
+            self.logger.warning(f"OpenGL disabled: {e}")
+    
     def apply_theme(self):
         """Apply dark theme to application"""
         self.setStyle('Fusion')
+        
+        # One font for the whole application; widgets inherit it instead of building their own
+        app_font = QFont("Segoe UI", 10)
+        app_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+        self.setFont(app_font)
         self. setPalette(DarkTheme.create_palette())
         self.setStyleSheet(DarkTheme.get_stylesheet())
     
-    def setup_system_tray(self):
-        """Setup system tray icon"""
-        if QSystemTrayIcon.isSystemTrayAvailable():
+    def _ensure_tray(self) -> Optional[QSystemTrayIcon]:
+        """Return the system tray icon, creating it on first use; None when there is no tray"""
+        if self.tray_icon is None and QSystemTrayIcon.isSystemTrayAvailable():
             self. tray_icon = QSystemTrayIcon(self)
+            self.tray_icon.setIcon(self.app_icon)
             
-            icon_path = Path("assets/icons/supersid_icon.png")
-            if icon_path.exists():
-                self.tray_icon.setIcon(QIcon(str(icon_path)))
-            
-            tray_menu = QMenu()
+            self.tray_menu = tray_menu = QMenu()
             
             show_action = QAction("Show SuperSID Pro", self)
             show_action.triggered.connect(self.main_window.show)
@@ -78,6 +165,13 @@ class SuperSIDProApp(QApplication):
             self.tray_icon.show()
             
             self.tray_icon.activated.connect(self.on_tray_activated)
+        
+        return self.tray_icon
+    
+    def _hide_tray(self):
+        """Remove the tray icon before the application exits"""
+        if self.tray_icon is not None:
+            self.tray_icon.hide()
     
     def on_tray_activated(self, reason):
         """Handle tray icon activation"""
@@ -88,41 +182,63 @@ class SuperSIDProApp(QApplication):
     
     def run(self) -> int:
         """Run the application"""
-        if self.config_manager.get('application.first_run', True):
-            reply = QMessageBox.question(
-                None,
-                "First Run Setup", 
-                "This appears to be your first time running SuperSID Pro.\n\n"
-                "Would you like to run the setup wizard to configure your observatory? ",
-                QMessageBox.StandardButton.Yes | QMessageBox. StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                # TODO: Implement setup dialog
-                pass
+        if self._first_run:
+            # Headless and CI launches take the defaults without prompting
+            if not os.environ.get("SUPERSID_NOGUI"):
+                self.run_first_run_setup()
             
-            self.config_manager.set('application.first_run', False)
-            self.config_manager.save_config()
+            self.config_manager.mark_first_run_done()
+            self._first_run = False
         
         self.main_window.show()
         return self.exec()
+    
+    def run_first_run_setup(self):
+        """Offer the setup wizard on the first launch"""
+        reply = QMessageBox.question(
+            None,
+            "First Run Setup", 
+            "This appears to be your first time running SuperSID Pro.\n\n"
+            "Would you like to run the setup wizard to configure your observatory? ",
+            QMessageBox.StandardButton.Yes | QMessageBox. StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            from gui.dialogs.setup_dialog import SetupDialog
+            SetupDialog(self.main_window).exec()
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, app: Optional[SuperSIDProApp] = None):
         super().__init__()
         
         self.config_manager = config_manager
         self.logger = get_logger(__name__)
-        
-        self.setup_ui()
-        self.setup_menubar()
-        self.setup_toolbar()
-        self.setup_statusbar()
+        self._app = app
+        self.vlf_integration: Optional[VLFGUIIntegration] = None
+        self._collector: Optional[DataCollector] = None
+        self._dirty_widgets = []
+        self.scheduler = TickScheduler(self)
+        
+        # Build the whole tree with painting off, so layout settles once
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_ui()
+            self.setup_menubar()
+            self.setup_toolbar()
+            self.setup_statusbar()
+        finally:
+            self.setUpdatesEnabled(True)
         
         self.start_monitoring()
         self.vlf_integration = VLFGUIIntegration(self.config_manager, self.vlf_widget)
+        QApplication.instance().aboutToQuit.connect(self.stop_data_collection)
+        
+        # One repaint tick for every buffered widget, independent of the capture rate
+        self.scheduler.every(33, self._tick_render)
+        self.scheduler.resume()
+        
         self.logger.info("Main window initialized")
     
     def setup_ui(self):
@@ -131,10 +247,6 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
         
-        icon_path = Path("assets/icons/supersid_icon.png")
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
-        
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
@@ -143,6 +255,8 @@ class MainWindow(QMainWindow):
         main_splitter = QSplitter(Qt. Orientation.Horizontal)
         main_layout.addWidget(main_splitter)
         
+        main_splitter.blockSignals(True)
+        
         left_panel = self.create_left_panel()
         main_splitter.addWidget(left_panel)
         
@@ -150,6 +264,7 @@ class MainWindow(QMainWindow):
         main_splitter.addWidget(right_panel)
         
         main_splitter. setSizes([400, 1000])
+        main_splitter.blockSignals(False)
     
     def create_left_panel(self) -> QWidget:
         """Create left control panel"""
@@ -159,6 +274,10 @@ class MainWindow(QMainWindow):
         
         layout = QVBoxLayout(panel)
         
+        from gui.widgets.observatory_widget import ObservatoryWidget
+        from gui.widgets.stations_widget import StationsWidget
+        from gui.widgets.space_weather_widget import SpaceWeatherWidget
+        
         # Observatory info widget
         self.observatory_widget = ObservatoryWidget(self.config_manager)
         layout.addWidget(self.observatory_widget)
@@ -170,6 +289,7 @@ class MainWindow(QMainWindow):
         # Space weather widget
         self.space_weather_widget = SpaceWeatherWidget(self.config_manager)
         layout.addWidget(self.space_weather_widget)
+        self._schedule_widget(self.space_weather_widget)
         
         layout.addStretch()
         
@@ -182,87 +302,106 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(panel)
         
         tab_widget = QTabWidget()
+        self.tab_widget = tab_widget
+        self._tab_factories = {}
         
         # Real-time monitoring tab (MAIN CHARTS TAB)
-        self.monitoring_tab = MonitoringWidget(self.config_manager)
-        tab_widget. addTab(self.monitoring_tab, "Real-time Monitoring")
+        self._add_lazy_tab("Real-time Monitoring", "monitoring_tab",
+                           "gui.widgets.monitoring_widget", "MonitoringWidget")
         
         # Historical data analysis tab
-        self.charts_tab = ChartWidget(self.config_manager)
-        tab_widget.addTab(self. charts_tab, "Historical Analysis")
+        self._add_lazy_tab("Historical Analysis", "charts_tab",
+                           "gui.widgets.chart_widget", "ChartWidget")
         
         # Space weather details tab
-        space_weather_detail = SpaceWeatherWidget(self.config_manager)
-        tab_widget.addTab(space_weather_detail, "Space Weather")
+        self._add_lazy_tab("Space Weather", "space_weather_detail",
+                           "gui.widgets.space_weather_widget", "SpaceWeatherWidget")
         
-        self.vlf_database_tab = VLFDatabaseWidget(self.config_manager)
-        tab_widget.addTab(self.vlf_database_tab, "VLF Database")
+        self._add_lazy_tab("VLF Database", "vlf_database_tab",
+                           "gui.widgets.vlf_database_widget", "VLFDatabaseWidget")
 
+        # Built eagerly, VLFGUIIntegration feeds it from startup
         self.vlf_widget = RealtimeVLFWidget()
         tab_widget.addTab(self. vlf_widget, "Real-time VLF")
+        self._schedule_widget(self.vlf_widget)
+        
+        tab_widget.currentChanged.connect(self._materialize_tab)
+        QTimer.singleShot(0, lambda: self._materialize_tab(tab_widget.currentIndex()))
         
         layout.addWidget(tab_widget)
         
         return panel
     
+    def _add_lazy_tab(self, label: str, attr: str, module: str, class_name: str):
+        """Add a placeholder tab whose widget is imported and built the first time it is shown"""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        
+        setattr(self, attr, None)
+        index = self.tab_widget.addTab(placeholder, label)
+        self._tab_factories[index] = (attr, module, class_name)
+    
+    def _materialize_tab(self, index: int):
+        """Build the real widget for a lazy tab on first selection"""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        
+        attr, module, class_name = entry
+        widget_class = getattr(importlib.import_module(module), class_name)
+        widget = widget_class(self.config_manager)
+        setattr(self, attr, widget)
+        self.tab_widget.widget(index).layout().addWidget(widget)
+        self._schedule_widget(widget)
+    
+    def _schedule_widget(self, widget):
+        """Drive a widget's redraws and periodic work from the shared scheduler"""
+        if hasattr(widget, 'flush'):
+            self._dirty_widgets.append(widget)
+        if hasattr(widget, 'periodic_tasks'):
+            for period_ms, callback in widget.periodic_tasks():
+                self.scheduler.every(period_ms, callback)
+    
+    def _tick_render(self):
+        """Let buffered widgets draw whatever arrived since the last tick"""
+        for widget in self._dirty_widgets:
+            widget.flush()
+    
+    # (menu, label, shortcut, slot name); a "-" label adds a separator
+    MENU_ACTIONS = (
+        ("File", "New Session", "Ctrl+N", "new_session"),
+        ("File", "Open Data File", "Ctrl+O", "open_data_file"),
+        ("File", "-", None, None),
+        ("File", "Export Data", "Ctrl+E", "export_data"),
+        ("File", "-", None, None),
+        ("File", "Exit", "Ctrl+Q", "close"),
+        ("View", "Toggle Fullscreen", "F11", "toggle_fullscreen"),
+        ("Tools", "Settings", "Ctrl+,", "show_settings"),
+        ("Tools", "Station Calibration", None, "show_calibration"),
+        ("Help", "About SuperSID Pro", None, "show_about"),
+        ("Help", "Documentation", "F1", "show_documentation"),
+    )
+    
     def setup_menubar(self):
         """Setup menu bar"""
         menubar = self.menuBar()
+        menus = {}
         
-        file_menu = menubar.addMenu("File")
-        
-        new_session_action = QAction("New Session", self)
-        new_session_action.setShortcut("Ctrl+N")
-        new_session_action.triggered.connect(self.new_session)
-        file_menu.addAction(new_session_action)
-        
-        open_data_action = QAction("Open Data File", self)
-        open_data_action.setShortcut("Ctrl+O")
-        open_data_action.triggered.connect(self.open_data_file)
-        file_menu.addAction(open_data_action)
-        
-        file_menu.addSeparator()
-        
-        export_action = QAction("Export Data", self)
-        export_action.setShortcut("Ctrl+E")
-        export_action.triggered.connect(self.export_data)
-        file_menu.addAction(export_action)
-        
-        file_menu. addSeparator()
-        
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self. close)
-        file_menu.addAction(exit_action)
-        
-        view_menu = menubar.addMenu("View")
-        
-        fullscreen_action = QAction("Toggle Fullscreen", self)
-        fullscreen_action.setShortcut("F11")
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
-        view_menu.addAction(fullscreen_action)
-        
-        tools_menu = menubar.addMenu("Tools")
-        
-        settings_action = QAction("Settings", self)
-        settings_action. setShortcut("Ctrl+,")
-        settings_action.triggered.connect(self.show_settings)
-        tools_menu.addAction(settings_action)
-        
-        calibration_action = QAction("Station Calibration", self)
-        calibration_action.triggered.connect(self.show_calibration)
-        tools_menu. addAction(calibration_action)
-        
-        help_menu = menubar.addMenu("Help")
-        
-        about_action = QAction("About SuperSID Pro", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
-        
-        docs_action = QAction("Documentation", self)
-        docs_action. setShortcut("F1")
-        docs_action. triggered.connect(self.show_documentation)
-        help_menu.addAction(docs_action)
+        for menu_name, label, shortcut, slot in self.MENU_ACTIONS:
+            menu = menus.get(menu_name)
+            if menu is None:
+                menu = menus[menu_name] = menubar.addMenu(menu_name)
+            
+            if label == "-":
+                menu.addSeparator()
+                continue
+            
+            action = QAction(label, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot))
+            menu.addAction(action)
     
     def setup_toolbar(self):
         """Setup toolbar"""
@@ -272,28 +411,14 @@ class MainWindow(QMainWindow):
         
         self.start_button = QPushButton("Pause")
         self.start_button. setToolTip("Pause/Resume monitoring")
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2d5a27;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3d7037;
-            }
-            QPushButton:pressed {
-                background-color: #1d4a17;
-            }
-        """)
+        self.start_button.setObjectName("startButton")
         self.start_button. clicked.connect(self.toggle_monitoring)
         toolbar.addWidget(self.start_button)
         
         toolbar.addSeparator()
         
-        self.connection_status = QLabel("🔴")
+        self.connection_status = QLabel()
+        self.connection_status.setPixmap(DarkTheme.dot_pixmap(DarkTheme.ERROR, 14))
         self.connection_status. setToolTip("Connection Status")
         toolbar.addWidget(self.connection_status)
         
@@ -329,27 +454,49 @@ class MainWindow(QMainWindow):
         self.time_label = QLabel()
         self.status_bar. addPermanentWidget(self. time_label)
         
-        # Update timer
-        self.status_timer = QTimer()
-        self.status_timer.timeout. connect(self.update_statusbar)
-        self.status_timer.start(1000)
+        self.scheduler.every(1000, self.update_statusbar)
     
     def start_monitoring(self):
         """Start monitoring processes"""
-        self.connection_status.setText("🟢")
+        self.connection_status.setPixmap(DarkTheme.dot_pixmap(DarkTheme.ACCENT, 14))
         self.start_button.setText("Pause")
         self.status_message.setText("Monitoring Active")
+        self.start_data_collection()
         
         self.logger.info("Monitoring started")
     
     def stop_monitoring(self):
         """Stop monitoring processes"""
-        self. connection_status.setText("🔴")
+        self.connection_status.setPixmap(DarkTheme.dot_pixmap(DarkTheme.ERROR, 14))
         self.start_button.setText("Start")
         self.status_message.setText("Monitoring Paused")
+        self.stop_data_collection()
         
         self. logger.info("Monitoring paused")
     
+    def start_data_collection(self):
+        """Start sound card capture on a worker thread"""
+        if self._collector is not None:
+            return
+        
+        self._collector = DataCollector(self.config_manager)
+        self._collector.data_ready.connect(self._on_data_block, Qt.ConnectionType.QueuedConnection)
+        self._collector.start()
+    
+    def stop_data_collection(self):
+        """Stop sound card capture and wait for the worker to finish"""
+        if self._collector is None:
+            return
+        
+        self._collector.requestInterruption()
+        self._collector.wait()
+        self._collector = None
+    
+    def _on_data_block(self, block):
+        """Forward a captured block to the monitoring tab once it has been built"""
+        if self.monitoring_tab is not None:
+            self.monitoring_tab.append_block(block)
+    
     def toggle_monitoring(self):
         """Toggle monitoring state"""
         if self.start_button.text() == "Pause":
@@ -359,11 +506,9 @@ class MainWindow(QMainWindow):
     
     def update_statusbar(self):
         """Update status bar information"""
-        from datetime import datetime
         import psutil
         
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_label. setText(f"{current_time}")
+        self._update_clock()
         
         try:
             memory = psutil.virtual_memory()
@@ -372,6 +517,10 @@ class MainWindow(QMainWindow):
         except:
             self.memory_label. setText("Memory: N/A")
     
+    def _update_clock(self):
+        """Show the current UTC time in the status bar"""
+        self.time_label.setText(QDateTime.currentDateTimeUtc().toString("HH:mm:ss 'UTC'"))
+    
     def new_session(self):
         """Start a new monitoring session"""
         self.logger. info("New session requested")
@@ -416,9 +565,7 @@ class MainWindow(QMainWindow):
     
     def take_screenshot(self):
         """Take screenshot of current view"""
-        from datetime import datetime
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = QDateTime.currentDateTime().toString("yyyyMMdd_HHmmss")
         filename = f"supersid_screenshot_{timestamp}.png"
         
         pixmap = self.grab()
@@ -461,18 +608,33 @@ class MainWindow(QMainWindow):
         self.logger.info("Documentation requested")
         # TODO: Open documentation
     
+    def showEvent(self, event):
+        """Resume periodic updates and capture when the window comes back from the tray"""
+        super().showEvent(event)
+        self.scheduler.resume()
+        # closeEvent only stops the worker; the toggle still says monitoring is on
+        if self.start_button.text() == "Pause":
+            self.start_data_collection()
+    
     def closeEvent(self, event):
         """Handle close event"""
-        if hasattr(self, 'vlf_integration'):
+        if self.vlf_integration is not None:
             self.vlf_integration.cleanup()
+        self.stop_data_collection()
+    
+        tray = self._app._ensure_tray() if self._app is not None else None
+        if tray is None:
+            # Nothing to restore the window from, so really close
+            event.accept()
+            return
     
         event.ignore()
         self.hide()
+        self.scheduler.pause()
     
-        if hasattr(QApplication.instance(), 'tray_icon'):
-            QApplication.instance().tray_icon.showMessage(
-                "SuperSID Pro",
-                "Application minimized to system tray",
-                QSystemTrayIcon.MessageIcon.Information,
-                2000
-            )
+        tray.showMessage(
+            "SuperSID Pro",
+            "Application minimized to system tray",
+            QSystemTrayIcon.MessageIcon.Information,
+            2000
+        )
@@ -3,7 +3,7 @@ Dark theme styling for SuperSID Pro
 Modern, professional dark theme with blue accents
 """
 
-from PyQt6.QtGui import QPalette, QColor
+from PyQt6.QtGui import QPalette, QColor, QPixmap, QPixmapCache, QPainter
 from PyQt6.QtCore import Qt
 
 class DarkTheme:
@@ -52,6 +52,25 @@ class DarkTheme:
         
         return palette
     
+    @staticmethod
+    def dot_pixmap(color: str, size: int = 12) -> QPixmap:
+        """Filled status dot, rendered once per color and size and kept in QPixmapCache"""
+        key = f"supersid_dot_{color}_{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawEllipse(1, 1, size - 2, size - 2)
+            painter.end()
+            
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
     @staticmethod
     def get_stylesheet() -> str:
         """Get complete application stylesheet"""
@@ -256,4 +275,22 @@ class DarkTheme:
         QSplitter::handle:vertical {{
             height: 2px;
         }}
+        
+        /* Toolbar start/pause button */
+        QPushButton#startButton {{
+            background-color: #2d5a27;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }}
+        
+        QPushButton#startButton:hover {{
+            background-color: #3d7037;
+        }}
+        
+        QPushButton#startButton:pressed {{
+            background-color: #1d4a17;
+        }}
         """
\ No newline at end of file
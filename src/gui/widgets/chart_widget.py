@@ -4,17 +4,18 @@ Displays VLF signal data, space weather overlays, and event detection
 """
 
 import sys
+import time
 from typing import Optional, Dict, List, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from dataclasses import dataclass
 import numpy as np
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QFrame,
     QComboBox, QLabel, QPushButton, QCheckBox, QSpinBox,
-    QGroupBox, QGridLayout, QSlider, QTabWidget
+    QGroupBox, QGridLayout, QSlider, QTabWidget, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject
+from PyQt6.QtGui import QFont, QPalette, QColor, QPen
 from PyQt6.QtCharts import (
     QChart, QChartView, QLineSeries, QValueAxis, QDateTimeAxis,
     QScatterSeries, QLegend, QAreaSeries
@@ -22,6 +23,7 @@ from PyQt6.QtCharts import (
 from PyQt6.QtCore import QDateTime, QPointF
 
 from core.config_manager import ConfigManager
+from core.plot_kernels import lttb as _lttb
 from core. logger import get_logger, log_execution_time  # FIXED: Import correct decorator
 from api.space_weather_mock import MockSpaceWeatherAPI
 
@@ -35,19 +37,43 @@ class ChartConfig:
     auto_scale: bool = True
     show_grid: bool = True
     line_width: float = 1.5
+    use_opengl: bool = False
+    backend: str = "qtcharts"  # "qtcharts" or "pyqtgraph"
     background_color: str = "#1e1e1e"
     text_color: str = "#ffffff"
     grid_color: str = "#404040"
 
-@dataclass
+@dataclass(init=False)
 class SignalData:
-    """VLF signal data point"""
-    timestamp: datetime
+    """VLF signal data point, timestamped in ms since epoch
+
+    Accepts either `ts_ms` or a `timestamp` datetime; `timestamp` is derived
+    from `ts_ms` on access.
+    """
+    ts_ms: int
     station_code: str
     frequency: float
     amplitude: float
     phase: float = 0.0
     snr: float = 0.0
+    
+    def __init__(self, timestamp: Optional[datetime] = None, station_code: str = "",
+                 frequency: float = 0.0, amplitude: float = 0.0, phase: float = 0.0,
+                 snr: float = 0.0, ts_ms: Optional[int] = None):
+        if ts_ms is None:
+            if timestamp is None:
+                raise ValueError("SignalData needs ts_ms or timestamp")
+            ts_ms = int(timestamp.timestamp() * 1000)
+        self.ts_ms = ts_ms
+        self.station_code = station_code
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.phase = phase
+        self.snr = snr
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.ts_ms / 1000)
 
 @dataclass
 class EventMarker:
@@ -58,13 +84,70 @@ class EventMarker:
     description: str
     color: str = "#ff0000"
 
-class DataGenerator(QObject):
-    """Simulates real-time VLF signal data for development"""
+class StationRing:
+    """Struct-of-arrays history of one station's samples
+
+    Holds the last `capacity` samples. Storage has room for `headroom`
+    times that, and appends write in place; when the end is reached the live
+    samples are moved back to the front, so every view is a contiguous slice
+    in time order and nothing is reallocated.
+    """
+    
+    def __init__(self, capacity: int, headroom: int = 2):
+        size = capacity * max(headroom, 2)
+        self.capacity = capacity
+        self.frequency = 0.0
+        self.ts = np.empty(size, dtype=np.int64)  # ms since epoch
+        self.amp = np.empty(size, dtype=np.float32)
+        self.phase = np.empty(size, dtype=np.float32)
+        self.snr = np.empty(size, dtype=np.float32)
+        self._start = 0
+        self._end = 0
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    def append(self, ts_ms: int, amplitude: float, phase: float, snr: float):
+        """Store one sample, dropping the oldest once capacity is reached"""
+        if self._end == self.ts.shape[0]:
+            self._compact()
+        i = self._end
+        self.ts[i] = ts_ms
+        self.amp[i] = amplitude
+        self.phase[i] = phase
+        self.snr[i] = snr
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+    
+    def _compact(self):
+        n = len(self)
+        for column in (self.ts, self.amp, self.phase, self.snr):
+            column[:n] = column[self._start:self._end]
+        self._start, self._end = 0, n
+    
+    def ts_view(self) -> np.ndarray:
+        return self.ts[self._start:self._end]
+    
+    def amp_view(self) -> np.ndarray:
+        return self.amp[self._start:self._end]
+    
+    def phase_view(self) -> np.ndarray:
+        return self.phase[self._start:self._end]
+    
+    def snr_view(self) -> np.ndarray:
+        return self.snr[self._start:self._end]
+
+class DataGenerator(QThread):
+    """Simulates real-time VLF signal data for development, off the GUI thread"""
+    
+    data_updated = pyqtSignal(object)  # SignalData, one emission per station
+    data_batch_updated = pyqtSignal(np.ndarray, np.ndarray, list)  # timestamps_ms, samples, station codes
     
-    data_updated = pyqtSignal(object)  # SignalData
+    interval_ms = 1000  # Generate data every second
     
-    def __init__(self, config_manager: ConfigManager):
-        super().__init__()
+    def __init__(self, config_manager: ConfigManager, parent: Optional[QObject] = None):
+        super().__init__(parent)
         self.config_manager = config_manager
         self.logger = get_logger(__name__)
         self.running = False
@@ -86,52 +169,75 @@ class DataGenerator(QObject):
                 VLFStation(code="DHO38", name="Burlage, Germany", frequency=23.4, enabled=True)
             ]
         
+        # Per-station constants, so each tick draws its random numbers in bulk
+        self._codes = [s.code for s in self.enabled_stations]
+        self._freqs = np.array([s.frequency for s in self.enabled_stations], dtype=np.float64)
+        self._rng = np.random.default_rng()
+        
         self.logger.info(f"Data generator initialized with {len(self.enabled_stations)} stations")
     
     def start_generation(self):
         """Start generating mock data"""
         self.running = True
-        self.timer = QTimer()
-        self. timer.timeout.connect(self. generate_data_point)
-        self.timer.start(1000)  # Generate data every second
+        if not self.isRunning():
+            self.start()
         
     def stop_generation(self):
         """Stop generating data"""
         self.running = False
-        if hasattr(self, 'timer'):
-            self.timer.stop()
+        self.requestInterruption()
+        self.wait()
+    
+    def run(self):
+        """Generation loop, runs until interruption is requested"""
+        while self.running and not self.isInterruptionRequested():
+            self.generate_data_point()
+            # Sleep in short slices so stopping does not wait a full interval
+            for _ in range(self.interval_ms // 50):
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(50)
     
     def generate_data_point(self):
         """Generate a simulated data point"""
         if not self.running:
             return
             
-        current_time = datetime.now()
+        now = time.time()
+        now_ms = int(now * 1000)
+        n = len(self._codes)
         
-        for station in self.enabled_stations:
-            # Simulate realistic VLF signal behavior
-            
-            # Base signal with slow trend
-            base_signal = self. base_amplitude + self.trend_factor * np.sin(current_time.timestamp() / 3600)
-            
-            # Add noise
-            noise = np.random.normal(0, self.noise_level)
-            
-            # Add solar activity influence (simulated)
-            solar_influence = self._simulate_solar_influence(current_time, station. frequency)
-            
-            # Calculate final amplitude
-            amplitude = base_signal + noise + solar_influence
-            
-            # Simulate phase and SNR
-            phase = np.random.uniform(0, 360)
-            snr = max(10, 40 + np.random.normal(0, 5))
-            
-            # Create data point
+        # Simulate realistic VLF signal behavior for all stations at once
+        
+        # Base signal with slow trend
+        base_signal = self.base_amplitude + self.trend_factor * np.sin(now / 3600)
+        
+        # Add noise
+        noise = self._rng.normal(0, self.noise_level, size=n)
+        
+        # Add solar activity influence (simulated)
+        solar_influence = self._simulate_solar_influence(time.localtime(now).tm_hour, n)
+        
+        # Calculate final amplitudes
+        amplitudes = base_signal + noise + solar_influence
+        
+        # Simulate phase and SNR
+        phases = self._rng.uniform(0, 360, size=n)
+        snrs = np.maximum(10, 40 + self._rng.normal(0, 5, size=n))
+        
+        # One emission for every station; samples columns are frequency, amplitude, phase, snr
+        timestamps_ms = np.full(n, now_ms, dtype=np.int64)
+        samples = np.column_stack((self._freqs, amplitudes, phases, snrs))
+        self.data_batch_updated.emit(timestamps_ms, samples, self._codes)
+        
+        # Per-station signal kept for existing listeners
+        if self.receivers(self.data_updated) == 0:
+            return
+        for code, (freq, amplitude, phase, snr) in zip(self._codes, samples.tolist()):
             data_point = SignalData(
-                timestamp=current_time,
-                station_code=station.code,
-                frequency=station.frequency,
+                ts_ms=now_ms,
+                station_code=code,
+                frequency=freq,
                 amplitude=amplitude,
                 phase=phase,
                 snr=snr
@@ -139,41 +245,269 @@ class DataGenerator(QObject):
             
             self.data_updated.emit(data_point)
     
-    def _simulate_solar_influence(self, timestamp: datetime, frequency: float) -> float:
-        """Simulate solar activity influence on VLF signals"""
+    def _simulate_solar_influence(self, hour: int, n: int) -> np.ndarray:
+        """Simulate solar activity influence on VLF signals for n stations at a local hour"""
         # Simulate day/night effect
-        hour = timestamp.hour
         day_factor = 1.0 if 6 <= hour <= 18 else 0.5
         
-        # Simulate solar flare effect (random events)
-        flare_probability = 0.001  # 0.1% chance per second
-        if np.random.random() < flare_probability:
-            # Simulate sudden ionospheric disturbance
-            return -np.random.uniform(5, 20)  # Signal decrease
+        # Simulate solar flare effect (random events, 0.1% chance per second)
+        flare = self._rng.random(n) < 0.001
         
-        # Normal solar influence
-        return day_factor * np.random.uniform(-1, 1)
+        # Sudden ionospheric disturbances decrease the signal; otherwise normal solar influence
+        return np.where(flare, -self._rng.uniform(5, 20, size=n), day_factor * self._rng.uniform(-1, 1, size=n))
+
+class SignalHistory:
+    """Station history, event detection and export shared by the chart backends
 
-class RealtimeChartView(QChartView):
-    """Real-time chart view with advanced features"""
+    Mixed into a QWidget subclass that defines `event_detected`, `config` and
+    `logger`, and implements `_append_to_series`, `_update_time_axis`,
+    `_auto_scale_amplitude` and `_plot_event_marker` for its drawing library.
+    """
+    
+    BASELINE_WINDOW = 60  # samples in the signal-drop baseline window
+    
+    # Event marker colors by severity
+    _SEVERITY_COLORS = {
+        'minor': "#ffaa00",
+        'moderate': "#ff8800",
+        'major': "#ff4444",
+        'extreme': "#ff0000"
+    }
+    
+    def _init_history(self):
+        """Set up data storage and dirty tracking"""
+        # Data storage
+        self.signal_data: Dict[str, StationRing] = {}
+        self._win_sum: Dict[str, float] = {}  # running sum of the last BASELINE_WINDOW amplitudes
+        self._win_len: Dict[str, int] = {}
+        self.event_markers: List[EventMarker] = []
+        
+        # Performance tracking
+        self.last_update_time = datetime.now()
+        self.update_count = 0
+        self._last_autoscale_ms = 0.0
+        
+        # Data only marks stations dirty; series and axes catch up on the host's render tick
+        self._dirty: set = set()
+    
+    def _add_history(self, station_code: str):
+        """Initialize data storage for a station"""
+        self.signal_data[station_code] = StationRing(self.config.max_data_points)
+        self._win_sum[station_code] = 0.0
+        self._win_len[station_code] = 0
+    
+    @log_execution_time("Chart update")  # FIXED: Use correct decorator
+    def update_data(self, data_point: SignalData):
+        """Update chart with new data point"""
+        self._ingest(data_point.station_code, data_point.ts_ms, data_point.frequency,
+                     data_point.amplitude, data_point.phase, data_point.snr)
+    
+    @log_execution_time("Chart batch update")
+    def update_data_batch(self, timestamps_ms: np.ndarray, samples: np.ndarray, codes: list):
+        """Update chart with one sample per station, as emitted by DataGenerator.data_batch_updated"""
+        for code, ts_ms, (freq, amplitude, phase, snr) in zip(codes, timestamps_ms.tolist(), samples.tolist()):
+            self._ingest(code, ts_ms, freq, amplitude, phase, snr)
+    
+    def _time_window(self):
+        """Current time and the left edge of the visible range, both in ms since epoch
+        
+        Read once per update and passed down, so one update sees one clock reading.
+        """
+        now_ms = int(time.time() * 1000)
+        return now_ms, now_ms - self.config.time_range_hours * 3_600_000
+    
+    def _ingest(self, station_code: str, ts_ms: int, frequency: float,
+                amplitude: float, phase: float, snr: float):
+        """Store one sample and mark its station for the next flush"""
+        if station_code not in self.signal_data:
+            return
+        
+        # Add to data storage; the ring drops the oldest sample past max_data_points
+        ring = self.signal_data[station_code]
+        ring.frequency = frequency
+        ring.append(ts_ms, amplitude, phase, snr)
+        self._update_window_sum(station_code, ring)
+        self._dirty.add(station_code)
+        
+        self.update_count += 1
+    
+    def _flush_dirty(self):
+        """Bring dirty series up to date, check them for events and follow with the axes"""
+        if not self._dirty:
+            return
+        
+        now_ms, cutoff_ms = self._time_window()
+        for station_code in self._dirty:
+            # Update chart series with just the new points
+            self._append_to_series(station_code, cutoff_ms)
+            
+            # Check for events
+            self._detect_events(station_code)
+        self._dirty.clear()
+        
+        self._refresh_view(now_ms, cutoff_ms)
+    
+    def _refresh_view(self, now_ms: int, cutoff_ms: int):
+        """Follow new data with the axes, once per flush"""
+        # Update time axis to show recent data
+        self._update_time_axis(now_ms)
+        
+        # Auto-scale if enabled; a 1 Hz feed does not need rescaling per sample
+        if self.config.auto_scale and abs(now_ms - self._last_autoscale_ms) >= 500:
+            self._last_autoscale_ms = now_ms
+            self._auto_scale_amplitude(cutoff_ms)
+    
+    @staticmethod
+    def _visible(ring: StationRing, cutoff_ms: int):
+        """Timestamps and amplitudes after cutoff_ms, as views into the ring"""
+        # Timestamps are in order, so the visible window starts at a binary-searched index
+        start = np.searchsorted(ring.ts_view(), cutoff_ms, side='right')
+        return ring.ts_view()[start:], ring.amp_view()[start:]
+    
+    def _amplitude_range(self, cutoff_ms: int):
+        """Padded (low, high) amplitude over the visible window of every station, or None without data"""
+        min_amp = float('inf')
+        max_amp = float('-inf')
+        
+        for ring in self.signal_data.values():
+            recent = self._visible(ring, cutoff_ms)[1]
+            if recent.size:
+                min_amp = min(min_amp, float(recent.min()))
+                max_amp = max(max_amp, float(recent.max()))
+        
+        if min_amp > max_amp:
+            return None
+        # Add some padding
+        padding = (max_amp - min_amp) * 0.1
+        return min_amp - padding, max_amp + padding
+    
+    def _update_window_sum(self, station_code: str, ring: StationRing):
+        """Slide the baseline window forward by the sample just appended"""
+        amps = ring.amp_view()
+        total = self._win_sum[station_code] + float(amps[-1])
+        if self._win_len[station_code] < self.BASELINE_WINDOW:
+            self._win_len[station_code] += 1
+        else:
+            total -= float(amps[-1 - self.BASELINE_WINDOW])
+        self._win_sum[station_code] = total
+    
+    def _detect_events(self, station_code: str):
+        """Detect significant events at the newest sample of a station"""
+        ring = self.signal_data[station_code]
+        
+        count = self._win_len[station_code]
+        if count < 10:  # Need some history
+            return
+        
+        # Baseline is the mean of the window without the newest sample
+        current = float(ring.amp_view()[-1])
+        baseline = (self._win_sum[station_code] - current) / (count - 1)
+        
+        # Detect sudden signal drop (possible flare effect)
+        threshold = 5.0  # dB
+        if baseline - current > threshold:
+            timestamp = datetime.fromtimestamp(int(ring.ts_view()[-1]) / 1000)
+            event_data = {
+                'station': station_code,
+                'baseline': baseline,
+                'current': current,
+                'drop': baseline - current,
+                'timestamp': timestamp
+            }
+            
+            self._add_event_marker(
+                timestamp,
+                'signal_drop',
+                'moderate' if event_data['drop'] < 10 else 'major',
+                f"Signal drop: {event_data['drop']:.1f}dB"
+            )
+            
+            self.event_detected. emit('signal_drop', event_data)
+    
+    def _add_event_marker(self, timestamp: datetime, event_type: str, severity: str, description: str):
+        """Add event marker to chart"""
+        marker = EventMarker(
+            timestamp=timestamp,
+            event_type=event_type,
+            severity=severity,
+            description=description,
+            color=self._SEVERITY_COLORS.get(severity, "#ff0000")
+        )
+        
+        self.event_markers.append(marker)
+        
+        # Add to all relevant event series
+        target_ms = int(timestamp.timestamp() * 1000)
+        
+        for station_code, ring in self.signal_data.items():
+            # Get amplitude at this time (approximate)
+            amplitude = -70  # Default marker position
+            
+            # Latest sample within 5 s of the event; timestamps are sorted
+            ts = ring.ts_view()
+            idx = int(np.searchsorted(ts, target_ms + 5000)) - 1
+            if idx >= 0 and ts[idx] > target_ms - 5000:
+                amplitude = float(ring.amp_view()[idx])
+            
+            self._plot_event_marker(station_code, target_ms, amplitude)
+    
+    def add_space_weather_overlay(self, flares: list, geomagnetic_data):
+        """Add space weather events as overlays"""
+        for flare in flares:
+            self._add_event_marker(
+                flare. timestamp,
+                'solar_flare',
+                'major' if flare.flare_class. startswith('M') else 'extreme' if flare.flare_class.startswith('X') else 'moderate',
+                f"Solar flare: {flare.flare_class}"
+            )
+    
+    def export_data(self, filename: str, format: str = "csv"):
+        """Export current chart data"""
+        import csv
+        from itertools import repeat
+        
+        if format. lower() == "csv":
+            with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                
+                # Header
+                writer.writerow(['Timestamp', 'Station', 'Frequency', 'Amplitude', 'Phase', 'SNR'])
+                
+                # Data, one bulk write per station straight from the ring columns
+                for station_code, ring in self.signal_data.items():
+                    timestamps = [datetime.fromtimestamp(ts_ms / 1000).isoformat()
+                                  for ts_ms in ring.ts_view().tolist()]
+                    writer.writerows(zip(
+                        timestamps,
+                        repeat(station_code),
+                        repeat(ring.frequency),
+                        ring.amp_view().astype(str),
+                        ring.phase_view().astype(str),
+                        ring.snr_view().astype(str)
+                    ))
+        
+        self.logger.info(f"Chart data exported to {filename}")
+
+class RealtimeChartView(SignalHistory, QChartView):
+    """Real-time chart view with advanced features, drawn with QtCharts"""
     
     # Signals
     event_detected = pyqtSignal(str, dict)  # event_type, event_data
     
+    _EVENT_BRUSH = QColor("#ff0000")
+    
     def __init__(self, config: ChartConfig, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self.config = config
         self.logger = get_logger(__name__)
         
-        # Data storage
-        self.signal_data: Dict[str, List[SignalData]] = {}
-        self.event_markers: List[EventMarker] = []
-        
         # Chart components
         self.chart = QChart()
         self.series: Dict[str, QLineSeries] = {}
+        self._station_pens: Dict[str, QPen] = {}
         self.event_series: Dict[str, QScatterSeries] = {}
+        self._series_end_ms: Dict[str, int] = {}  # newest timestamp already in each series
         
         # Axes
         self.time_axis = QDateTimeAxis()
@@ -183,9 +517,7 @@ class RealtimeChartView(QChartView):
         self.setup_axes()
         self.apply_theme()
         
-        # Performance tracking
-        self.last_update_time = datetime.now()
-        self.update_count = 0
+        self._init_history()
     
     def setup_chart(self):
         """Setup the main chart"""
@@ -244,7 +576,13 @@ class RealtimeChartView(QChartView):
         # Create main signal series
         series = QLineSeries()
         series.setName(f"{station_code} ({station_name})")
-        series.setPen(QColor(color), self.config.line_width)
+        pen = self._station_pens.get(station_code)
+        if pen is None:
+            pen = QPen(QColor(color))
+            pen.setWidthF(self.config.line_width)
+            self._station_pens[station_code] = pen
+        series.setPen(pen)
+        series.setUseOpenGL(self.config.use_opengl)
         
         self.chart.addSeries(series)
         series.attachAxis(self.time_axis)
@@ -256,7 +594,8 @@ class RealtimeChartView(QChartView):
         event_series = QScatterSeries()
         event_series.setName(f"{station_code} Events")
         event_series.setMarkerSize(8)
-        event_series.setBrush(QColor("#ff0000"))
+        event_series.setBrush(self._EVENT_BRUSH)
+        event_series.setUseOpenGL(self.config.use_opengl)
         
         self.chart.addSeries(event_series)
         event_series.attachAxis(self.time_axis)
@@ -265,199 +604,105 @@ class RealtimeChartView(QChartView):
         self. event_series[station_code] = event_series
         
         # Initialize data storage
-        self.signal_data[station_code] = []
+        self._add_history(station_code)
+        self._series_end_ms[station_code] = 0
         
         self.logger.info(f"Added station {station_code} to chart")
     
-    @log_execution_time("Chart update")  # FIXED: Use correct decorator
-    def update_data(self, data_point: SignalData):
-        """Update chart with new data point"""
-        station_code = data_point.station_code
-        
-        if station_code not in self.series:
-            return
-        
-        # Add to data storage
-        self.signal_data[station_code].append(data_point)
-        
-        # Limit data points to prevent memory issues
-        if len(self.signal_data[station_code]) > self.config.max_data_points:
-            self.signal_data[station_code] = self.signal_data[station_code][-self.config. max_data_points:]
-        
-        # Update chart series
-        self._update_series(station_code)
-        
-        # Update time axis to show recent data
-        self._update_time_axis()
-        
-        # Auto-scale if enabled
-        if self.config.auto_scale:
-            self._auto_scale_amplitude()
-        
-        # Check for events
-        self._detect_events(data_point)
-        
-        self.update_count += 1
-    
-    def _update_series(self, station_code: str):
-        """Update a specific station's series data"""
+    def _update_series(self, station_code: str, cutoff_ms: Optional[int] = None):
+        """Rebuild a station's series from its history (time range changes, resizes, overgrown series)"""
         series = self.series[station_code]
-        data_points = self.signal_data[station_code]
-        
-        # Clear existing points
-        series.clear()
+        ring = self.signal_data[station_code]
         
         # Add recent points
-        cutoff_time = datetime.now() - timedelta(hours=self. config.time_range_hours)
-        recent_points = [p for p in data_points if p.timestamp > cutoff_time]
-        
-        for point in recent_points:
-            qt_time = QDateTime.fromSecsSinceEpoch(int(point.timestamp. timestamp()))
-            series.append(qt_time. toMSecsSinceEpoch(), point.amplitude)
-    
-    def _update_time_axis(self):
+        if cutoff_ms is None:
+            cutoff_ms = self._time_window()[1]
+        times, amplitudes = self._visible(ring, cutoff_ms)
+        
+        # At most two points per pixel column reach QtCharts
+        points = _lttb(times, amplitudes, 2 * self._plot_width())
+        series.replace([QPointF(t, a) for t, a in points.tolist()])
+        if times.size:
+            self._series_end_ms[station_code] = int(times[-1])
+    
+    def _append_to_series(self, station_code: str, cutoff_ms: int):
+        """Append the points stored since the last flush and drop points that scrolled out on the left"""
+        series = self.series[station_code]
+        ring = self.signal_data[station_code]
+        
+        ts = ring.ts_view()
+        start = np.searchsorted(ts, self._series_end_ms[station_code], side='right')
+        if start < ts.shape[0]:
+            series.append([QPointF(t, a) for t, a in zip(ts[start:].tolist(), ring.amp_view()[start:].tolist())])
+            self._series_end_ms[station_code] = int(ts[-1])
+        self._prune_series(series, cutoff_ms)
+        
+        # Appended points are not downsampled; resample once they reach twice the LTTB budget
+        width = self._plot_width()
+        if width > 0 and series.count() > 4 * width:
+            self._update_series(station_code, cutoff_ms)
+    
+    @staticmethod
+    def _prune_series(series: QLineSeries, cutoff_ms: int):
+        """Remove the points at or before cutoff_ms from the left of a series in one call"""
+        expired = 0
+        count = series.count()
+        while expired < count and series.at(expired).x() <= cutoff_ms:
+            expired += 1
+        if expired:
+            series.removePoints(0, expired)
+    
+    def _plot_width(self) -> int:
+        """Width of the plot area in pixels, or 0 before the first layout"""
+        return int(self.chart.plotArea().width())
+    
+    def resizeEvent(self, event):
+        """Resample the traces for the new plot width"""
+        old_width = self._plot_width()
+        super().resizeEvent(event)
+        if self._plot_width() != old_width:
+            cutoff_ms = self._time_window()[1]
+            for station_code in self.series:
+                self._update_series(station_code, cutoff_ms)
+    
+    def _update_time_axis(self, now_ms: Optional[int] = None):
         """Update time axis range to show recent data"""
-        now = QDateTime.currentDateTime()
+        if now_ms is None:
+            now_ms = self._time_window()[0]
+        now = QDateTime.fromMSecsSinceEpoch(now_ms)
         start_time = now.addSecs(-self.config.time_range_hours * 3600)
         
         self.time_axis.setRange(start_time, now)
     
-    def _auto_scale_amplitude(self):
+    def _auto_scale_amplitude(self, cutoff_ms: Optional[int] = None):
         """Auto-scale amplitude axis based on current data"""
-        all_amplitudes = []
-        cutoff_time = datetime.now() - timedelta(hours=self. config.time_range_hours)
-        
-        for data_points in self.signal_data.values():
-            recent_amplitudes = [
-                p.amplitude for p in data_points 
-                if p.timestamp > cutoff_time
-            ]
-            all_amplitudes.extend(recent_amplitudes)
-        
-        if all_amplitudes:
-            min_amp = min(all_amplitudes)
-            max_amp = max(all_amplitudes)
-            
-            # Add some padding
-            padding = (max_amp - min_amp) * 0.1
-            self.amplitude_axis.setRange(
-                min_amp - padding,
-                max_amp + padding
-            )
+        if cutoff_ms is None:
+            cutoff_ms = self._time_window()[1]
+        amplitude_range = self._amplitude_range(cutoff_ms)
+        if amplitude_range is not None:
+            self.amplitude_axis.setRange(*amplitude_range)
     
-    def _detect_events(self, data_point: SignalData):
-        """Detect significant events in the signal"""
-        station_code = data_point.station_code
-        station_data = self.signal_data[station_code]
-        
-        if len(station_data) < 10:  # Need some history
-            return
-        
-        # Calculate recent baseline
-        recent_data = station_data[-60:]  # Last 60 seconds
-        baseline = np.mean([p.amplitude for p in recent_data[:-1]])
-        current = data_point.amplitude
-        
-        # Detect sudden signal drop (possible flare effect)
-        threshold = 5.0  # dB
-        if baseline - current > threshold:
-            event_data = {
-                'station': station_code,
-                'baseline': baseline,
-                'current': current,
-                'drop': baseline - current,
-                'timestamp': data_point.timestamp
-            }
-            
-            self._add_event_marker(
-                data_point.timestamp,
-                'signal_drop',
-                'moderate' if event_data['drop'] < 10 else 'major',
-                f"Signal drop: {event_data['drop']:.1f}dB"
-            )
-            
-            self.event_detected. emit('signal_drop', event_data)
-    
-    def _add_event_marker(self, timestamp: datetime, event_type: str, severity: str, description: str):
-        """Add event marker to chart"""
-        # Color based on severity
-        colors = {
-            'minor': "#ffaa00",
-            'moderate': "#ff8800", 
-            'major': "#ff4444",
-            'extreme': "#ff0000"
-        }
-        
-        marker = EventMarker(
-            timestamp=timestamp,
-            event_type=event_type,
-            severity=severity,
-            description=description,
-            color=colors. get(severity, "#ff0000")
-        )
-        
-        self.event_markers.append(marker)
-        
-        # Add to all relevant event series
-        qt_time = QDateTime.fromSecsSinceEpoch(int(timestamp.timestamp()))
-        
-        for station_code, event_series in self.event_series.items():
-            if station_code in self.signal_data:
-                # Get amplitude at this time (approximate)
-                station_data = self.signal_data[station_code]
-                amplitude = -70  # Default marker position
-                
-                for point in reversed(station_data):
-                    if abs((point.timestamp - timestamp).total_seconds()) < 5:
-                        amplitude = point. amplitude
-                        break
-                
-                event_series.append(qt_time.toMSecsSinceEpoch(), amplitude)
-    
-    def add_space_weather_overlay(self, flares: list, geomagnetic_data):
-        """Add space weather events as overlays"""
-        for flare in flares:
-            self._add_event_marker(
-                flare. timestamp,
-                'solar_flare',
-                'major' if flare.flare_class. startswith('M') else 'extreme' if flare.flare_class.startswith('X') else 'moderate',
-                f"Solar flare: {flare.flare_class}"
-            )
+    def _plot_event_marker(self, station_code: str, ts_ms: int, amplitude: float):
+        """Draw one event marker on a station's event series"""
+        self.event_series[station_code].append(ts_ms, amplitude)
     
     def set_time_range(self, hours: int):
         """Set the time range for display"""
+        widened = hours > self.config.time_range_hours
         self.config.time_range_hours = hours
-        self._update_time_axis()
+        now_ms, cutoff_ms = self._time_window()
+        self._update_time_axis(now_ms)
         
-        # Update all series
-        for station_code in self.series. keys():
-            self._update_series(station_code)
-    
-    def export_data(self, filename: str, format: str = "csv"):
-        """Export current chart data"""
-        import csv
-        
-        if format. lower() == "csv":
-            with open(filename, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Header
-                writer.writerow(['Timestamp', 'Station', 'Frequency', 'Amplitude', 'Phase', 'SNR'])
-                
-                # Data
-                for station_code, data_points in self.signal_data.items():
-                    for point in data_points:
-                        writer.writerow([
-                            point.timestamp.isoformat(),
-                            point.station_code,
-                            point.frequency,
-                            point.amplitude,
-                            point. phase,
-                            point.snr
-                        ])
+        if widened:
+            # Older history comes back into view; rebuild each series once from its ring
+            for station_code in self.series. keys():
+                self._update_series(station_code, cutoff_ms)
+            return
         
-        self.logger.info(f"Chart data exported to {filename}")
-
+        # Narrower window: the series already hold every visible point, only drop the old ones
+        for series in self.series.values():
+            self._prune_series(series, cutoff_ms)
+    
 class ChartWidget(QWidget):
     """Main chart widget with controls and multiple views"""
     
@@ -478,14 +723,20 @@ class ChartWidget(QWidget):
             auto_scale=display_config.get('auto_scale', True),
             show_grid=display_config.get('show_grid', True),
             line_width=display_config.get('line_width', 1.5),
+            use_opengl=bool(config_manager.get('rendering.opengl', True)),
+            backend=config_manager.get('rendering.chart_backend', 'qtcharts'),
             background_color=display_config.get('chart_colors', {}).get('background', '#1e1e1e'),
             text_color=display_config.get('chart_colors', {}).get('text', '#ffffff'),
             grid_color=display_config.get('chart_colors', {}).get('grid', '#404040')
         )
         
-        # Data generator
-        self.data_generator = DataGenerator(config_manager)
-        self.data_generator.data_updated.connect(self.on_data_updated)
+        # Data generator, owned by this widget; closeEvent never runs for an embedded
+        # widget, so the thread is also joined on quit before Qt destroys it
+        self.data_generator = DataGenerator(config_manager, self)
+        self.data_generator.data_batch_updated.connect(
+            self.on_data_batch_updated, Qt.ConnectionType.QueuedConnection
+        )
+        QApplication.instance().aboutToQuit.connect(self.data_generator.stop_generation)
         
         self.setup_ui()
         self.setup_stations()
@@ -500,7 +751,7 @@ class ChartWidget(QWidget):
         layout.addWidget(controls_panel)
         
         # Main chart view
-        self.chart_view = RealtimeChartView(self.chart_config)
+        self.chart_view = self.create_chart_view()
         self.chart_view.event_detected.connect(self.event_detected.emit)
         layout.addWidget(self.chart_view)
         
@@ -508,6 +759,16 @@ class ChartWidget(QWidget):
         status_panel = self. create_status_panel()
         layout.addWidget(status_panel)
         
+    def create_chart_view(self):
+        """Build the chart view for the configured backend"""
+        if self.chart_config.backend == "pyqtgraph":
+            try:
+                from gui.widgets.pyqtgraph_chart_view import PyQtGraphChartView
+                return PyQtGraphChartView(self.chart_config)
+            except ImportError as e:
+                self.logger.warning(f"pyqtgraph chart backend unavailable, using QtCharts: {e}")
+        return RealtimeChartView(self.chart_config)
+    
     def create_controls_panel(self) -> QWidget:
         """Create controls panel"""
         panel = QFrame()
@@ -583,10 +844,10 @@ class ChartWidget(QWidget):
         self.time_label = QLabel()
         layout.addWidget(self.time_label)
         
-        # Update timer
-        self.status_timer = QTimer()
-        self.status_timer.timeout. connect(self.update_status)
-        self.status_timer. start(1000)
+        # Last displayed values, so unchanged labels are not repainted
+        self._last_time_str = ""
+        self._last_event_count = -1
+        self._last_update_count = -1
         
         return panel
     
@@ -654,19 +915,38 @@ class ChartWidget(QWidget):
         """Handle new data point"""
         self.chart_view.update_data(data_point)
     
+    def on_data_batch_updated(self, timestamps_ms: np.ndarray, samples: np.ndarray, codes: list):
+        """Handle one new sample per station"""
+        self.chart_view.update_data_batch(timestamps_ms, samples, codes)
+    
+    def flush(self):
+        """Draw whatever arrived since the last call; called on the host window's render tick"""
+        self.chart_view._flush_dirty()
+    
+    def periodic_tasks(self):
+        """(period_ms, callback) pairs for the host window's scheduler"""
+        return ((1000, self.update_status),)
+    
     def update_status(self):
         """Update status panel"""
         # Current time
-        self.time_label.setText(datetime.now().strftime("%H:%M:%S UTC"))
+        time_str = datetime.now(timezone.utc).strftime("%H:%M:%S UTC")
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self.time_label.setText(time_str)
         
         # Update event count
         event_count = len(self.chart_view.event_markers)
-        self.events_label.setText(str(event_count))
+        if event_count != self._last_event_count:
+            self._last_event_count = event_count
+            self.events_label.setText(str(event_count))
         
         # Calculate data rate
-        if hasattr(self. chart_view, 'update_count'):
+        update_count = self.chart_view.update_count
+        if update_count != self._last_update_count:
             # Simple rate calculation
-            self.data_rate_label.setText(f"~{self.chart_view.update_count} Hz")
+            self._last_update_count = update_count
+            self.data_rate_label.setText(f"~{update_count} Hz")
     
     def export_data(self):
         """Export current chart data"""
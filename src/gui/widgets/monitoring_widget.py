@@ -4,15 +4,18 @@ Combines charts, space weather, and station status
 """
 
 from typing import Optional  # FIXED: Add missing import
+import numpy as np
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QTabWidget,
-    QGroupBox, QLabel, QFrame, QPushButton, QTextEdit, QScrollArea
+    QGroupBox, QLabel, QFrame, QPushButton, QPlainTextEdit, QScrollArea
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QPixmap
 
 from core.config_manager import ConfigManager
 from core.logger import get_logger
+from core.ring_buffer import RingBuffer
+from gui.styles.dark_theme import DarkTheme
 from gui.widgets.chart_widget import ChartWidget
 from gui.widgets. space_weather_widget import SpaceWeatherWidget
 
@@ -31,11 +34,13 @@ class AlertPanel(QFrame):
         header_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #0078d4;")
         layout.addWidget(header_label)
         
-        # Alerts area
-        self.alerts_area = QTextEdit()
+        # Alerts area; one block per alert, the oldest dropped past 500
+        self.alerts_area = QPlainTextEdit()
+        self.alerts_area.setReadOnly(True)
+        self.alerts_area.setMaximumBlockCount(500)
         self. alerts_area.setMaximumHeight(100)
         self.alerts_area.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 border: 1px solid #404040;
                 border-radius: 4px;
@@ -68,14 +73,9 @@ class AlertPanel(QFrame):
         
         color = colors.get(alert_type, "#ffffff")
         
-        alert_html = f"""
-        <p style="color: {color}; margin: 2px;">
-        <b>[{timestamp}]</b> {alert_type. upper()}: {message}
-        </p>
-        """
+        alert_html = f'<span style="color: {color}"><b>[{timestamp}]</b> {alert_type.upper()}: {message}</span>'
         
-        self.alerts_area.insertHtml(alert_html)
-        self.alerts_area.ensureCursorVisible()
+        self.alerts_area.appendHtml(alert_html)
     
     def clear_alerts(self):
         """Clear all alerts"""
@@ -131,12 +131,12 @@ class StationStatusPanel(QFrame):
             # Status indicator
             status_layout = QHBoxLayout()
             
-            status_indicator = QLabel("●")
+            status_indicator = QLabel()
             if station.enabled:
-                status_indicator.setStyleSheet("color: #00ff00; font-size: 16px;")
+                status_indicator.setPixmap(DarkTheme.dot_pixmap("#00ff00"))
                 status_text = "Active"
             else:
-                status_indicator.setStyleSheet("color: #808080; font-size: 16px;")
+                status_indicator.setPixmap(DarkTheme.dot_pixmap("#808080"))
                 status_text = "Disabled"
             
             status_layout.addWidget(status_indicator)
@@ -158,6 +158,12 @@ class MonitoringWidget(QWidget):
         self.config_manager = config_manager
         self.logger = get_logger(__name__)
         
+        # Last 100 ms of captured input, filled by append_block and drawn by flush
+        sample_rate = int(config_manager.get('sampling.sample_rate', 48000))
+        channels = int(config_manager.get('sampling.channels', 1))
+        self.samples = RingBuffer(max(sample_rate // 10, 1), channels=channels, dtype=np.float32)
+        self._dirty = False
+        
         self. setup_ui()
         self.connect_signals()
         
@@ -200,6 +206,11 @@ class MonitoringWidget(QWidget):
         self.station_status = StationStatusPanel(self.config_manager)
         layout.addWidget(self.station_status)
         
+        # Sound card input level
+        self.input_level_label = QLabel("Input level: --")
+        self.input_level_label.setStyleSheet("color: #b3b3b3;")
+        layout.addWidget(self.input_level_label)
+        
         # Space weather (compact view)
         self.space_weather = SpaceWeatherWidget(self. config_manager)
         self.space_weather.setMaximumHeight(300)
@@ -213,6 +224,32 @@ class MonitoringWidget(QWidget):
         
         return panel
     
+    def append_block(self, block: np.ndarray):
+        """Buffer a block of captured samples, shape (frames, channels)
+
+        No Qt work happens here; the host window calls flush() on its render tick.
+        """
+        if block.size == 0:
+            return
+        self.samples.extend(block)
+        self._dirty = True
+    
+    def flush(self):
+        """Redraw from the buffered samples if anything arrived since the last call"""
+        self.chart_widget.flush()
+        if not self._dirty:
+            return
+        self._dirty = False
+        
+        window = self.samples.view()
+        rms = float(np.sqrt(np.mean(np.square(window, dtype=np.float64))))
+        level = 20.0 * np.log10(rms) if rms > 0 else float('-inf')
+        self.input_level_label.setText(f"Input level: {level:.1f} dBFS")
+    
+    def periodic_tasks(self):
+        """(period_ms, callback) pairs for the host window's scheduler"""
+        return self.chart_widget.periodic_tasks() + self.space_weather.periodic_tasks()
+    
     def connect_signals(self):
         """Connect widget signals"""
         # Chart events
@@ -16,6 +16,7 @@ from datetime import datetime
 
 from core.config_manager import ConfigManager, ObservatoryConfig
 from core. logger import get_logger
+from gui.styles.dark_theme import DarkTheme
 
 class ObservatoryWidget(QGroupBox):
     """Widget for observatory configuration and information"""
@@ -127,8 +128,8 @@ class ObservatoryWidget(QGroupBox):
         status_layout = QHBoxLayout(status_frame)
         
         # Status indicator
-        self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet("color: #ff4444; font-size: 24px;")
+        self.status_indicator = QLabel()
+        self.status_indicator.setPixmap(DarkTheme.dot_pixmap("#ff4444", 16))
         status_layout.addWidget(self. status_indicator)
         
         # Status text
@@ -350,12 +351,12 @@ class ObservatoryWidget(QGroupBox):
         )
         
         if is_complete:
-            self.status_indicator.setStyleSheet("color: #00ff00; font-size: 24px;")
+            self.status_indicator.setPixmap(DarkTheme.dot_pixmap("#00ff00", 16))
             self.status_label.setText("Configuration Complete")
             self.status_label.setStyleSheet("color: #00ff00; font-weight: bold; font-size: 14px;")
             self.monitor_id_display. setText(f"Monitor: #{config.monitor_id:03d}")
         else:
-            self.status_indicator.setStyleSheet("color: #ffaa00; font-size: 24px;")
+            self.status_indicator.setPixmap(DarkTheme.dot_pixmap("#ffaa00", 16))
             self.status_label.setText("Configuration Incomplete")
             self.status_label.setStyleSheet("color: #ffaa00; font-weight: bold; font-size: 14px;")
             self.monitor_id_display.setText("Monitor: --")
@@ -0,0 +1,121 @@
+"""
+pyqtgraph backend for the real-time VLF chart
+Draws each station straight from its ring, for histories QtCharts handles poorly
+"""
+from typing import Optional, Dict
+
+import pyqtgraph as pg
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+from core.logger import get_logger
+from core.plot_kernels import downsample_m4
+from gui.widgets.chart_widget import ChartConfig, SignalHistory
+
+class PyQtGraphChartView(SignalHistory, QWidget):
+    """Real-time chart view drawn with pyqtgraph
+
+    Same interface as RealtimeChartView. Curves are redrawn from an M4
+    reduction of the visible window, so at most four points per pixel column
+    reach the scene whatever the history length. pyqtgraph's date axis works
+    in seconds, so ring timestamps are scaled from ms on the way in.
+    """
+    
+    # Signals
+    event_detected = pyqtSignal(str, dict)  # event_type, event_data
+    
+    def __init__(self, config: ChartConfig, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        
+        self.config = config
+        self.logger = get_logger(__name__)
+        
+        self.curves: Dict[str, pg.PlotDataItem] = {}
+        self.event_points: Dict[str, pg.ScatterPlotItem] = {}
+        
+        self.setup_plot()
+        self._init_history()
+    
+    def setup_plot(self):
+        """Setup the plot, axes and theme"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.plot_widget = pg.PlotWidget(
+            title=self.config.title,
+            background=self.config.background_color,
+            axisItems={'bottom': pg.DateAxisItem(orientation='bottom')}
+        )
+        self.plot = self.plot_widget.getPlotItem()
+        self.plot.setLabel('bottom', "Time (UTC)")
+        self.plot.setLabel('left', "Signal Strength (dB)")
+        for axis in ('bottom', 'left'):
+            self.plot.getAxis(axis).setTextPen(self.config.text_color)
+        self.plot.showGrid(x=self.config.show_grid, y=self.config.show_grid, alpha=0.3)
+        self.plot.setYRange(-120, -40)  # Typical VLF range
+        self.plot.addLegend()
+        
+        layout.addWidget(self.plot_widget)
+    
+    def add_station(self, station_code: str, station_name: str, color: str):
+        """Add a VLF station to the chart"""
+        self.curves[station_code] = self.plot.plot(
+            pen=pg.mkPen(color, width=self.config.line_width),
+            name=f"{station_code} ({station_name})"
+        )
+        
+        event_points = pg.ScatterPlotItem(size=8, pen=None, brush=pg.mkBrush("#ff0000"))
+        self.plot.addItem(event_points)
+        self.event_points[station_code] = event_points
+        
+        self._add_history(station_code)
+        
+        self.logger.info(f"Added station {station_code} to chart")
+    
+    def _plot_width(self) -> int:
+        """Width of the plot area in pixels, or 0 before the first layout"""
+        return int(self.plot.getViewBox().width())
+    
+    def _append_to_series(self, station_code: str, cutoff_ms: int):
+        """Redraw a station's curve from the visible part of its ring"""
+        times, amplitudes = self._visible(self.signal_data[station_code], cutoff_ms)
+        times, amplitudes = downsample_m4(times, amplitudes, self._plot_width())
+        self.curves[station_code].setData(times * 1e-3, amplitudes)
+    
+    def _redraw(self):
+        """Redraw every curve and the axes without running event detection"""
+        now_ms, cutoff_ms = self._time_window()
+        for station_code in self.curves:
+            self._append_to_series(station_code, cutoff_ms)
+        self._update_time_axis(now_ms)
+    
+    def resizeEvent(self, event):
+        """Resample the curves for the new plot width"""
+        old_width = self._plot_width()
+        super().resizeEvent(event)
+        if self._plot_width() != old_width:
+            self._redraw()
+    
+    def _update_time_axis(self, now_ms: Optional[int] = None):
+        """Update time axis range to show recent data"""
+        if now_ms is None:
+            now_ms = self._time_window()[0]
+        start_ms = now_ms - self.config.time_range_hours * 3_600_000
+        self.plot.setXRange(start_ms * 1e-3, now_ms * 1e-3, padding=0)
+    
+    def _auto_scale_amplitude(self, cutoff_ms: Optional[int] = None):
+        """Auto-scale amplitude axis based on current data"""
+        if cutoff_ms is None:
+            cutoff_ms = self._time_window()[1]
+        amplitude_range = self._amplitude_range(cutoff_ms)
+        if amplitude_range is not None:
+            self.plot.setYRange(*amplitude_range, padding=0)
+    
+    def _plot_event_marker(self, station_code: str, ts_ms: int, amplitude: float):
+        """Draw one event marker on a station's event scatter"""
+        self.event_points[station_code].addPoints(x=[ts_ms * 1e-3], y=[amplitude])
+    
+    def set_time_range(self, hours: int):
+        """Set the time range for display"""
+        self.config.time_range_hours = hours
+        self._redraw()
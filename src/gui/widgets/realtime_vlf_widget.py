@@ -6,15 +6,16 @@ import sys
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGridLayout, QPushButton)
 from PyQt6.QtCore import QTimer, pyqtSignal, Qt
-from PyQt6.QtGui import QFont, QPalette
+from PyQt6.QtGui import QPalette
 import pyqtgraph as pg
-from collections import deque
-import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 from core.vlf_processor import VLFSignal
 from core.logger import get_logger
+from core.ring_buffer import RingBuffer
+
+BAND_IDS = ('BAND_1', 'BAND_2', 'BAND_3', 'BAND_4')
 
 class RealtimeVLFWidget(QWidget):
     """Real-time VLF visualization dashboard"""
@@ -26,15 +27,13 @@ class RealtimeVLFWidget(QWidget):
         super().__init__(parent)
         self. logger = get_logger(__name__)
         
-        # Data storage for real-time plotting
+        # Data storage for real-time plotting: row 0 is time in seconds since
+        # the first sample, rows 1.. are the band amplitudes
         self.max_points = 1000  # Keep last 1000 data points
-        self.time_data = deque(maxlen=self.max_points)
-        self.amplitude_data = {
-            'BAND_1': deque(maxlen=self.max_points),
-            'BAND_2': deque(maxlen=self.max_points),
-            'BAND_3': deque(maxlen=self.max_points),
-            'BAND_4': deque(maxlen=self.max_points)
-        }
+        self.samples = RingBuffer(self.max_points, channels=1 + len(BAND_IDS))
+        self._start_time: Optional[datetime] = None
+        self._last_time: Optional[datetime] = None
+        self._dirty = False
         
         # Chart references
         self.charts = {}
@@ -43,11 +42,6 @@ class RealtimeVLFWidget(QWidget):
         # Setup UI
         self._setup_ui()
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout. connect(self._update_charts)
-        self.update_timer.start(100)  # Update every 100ms
-        
         self.logger.info("Real-time VLF visualization widget initialized")
     
     def _setup_ui(self):
@@ -56,7 +50,7 @@ class RealtimeVLFWidget(QWidget):
         
         # Title
         title = QLabel("Real-time VLF Signal Monitor")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setObjectName("vlfTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -78,6 +72,14 @@ class RealtimeVLFWidget(QWidget):
                 color: #ffffff;
                 padding: 5px;
             }
+            QLabel#vlfTitle {
+                font-size: 16pt;
+                font-weight: bold;
+            }
+            QLabel#bandValue {
+                font-family: "Courier";
+                font-size: 10pt;
+            }
             QFrame {
                 border: 1px solid #555555;
                 border-radius: 5px;
@@ -205,9 +207,9 @@ class RealtimeVLFWidget(QWidget):
         
         # Current values display
         self.current_values = {}
-        for band_id in ['BAND_1', 'BAND_2', 'BAND_3', 'BAND_4']:
+        for band_id in BAND_IDS:
             label = QLabel(f"{band_id}: 0. 000")
-            label.setFont(QFont("Courier", 10))
+            label.setObjectName("bandValue")
             status_layout.addWidget(label)
             self. current_values[band_id] = label
         
@@ -232,47 +234,46 @@ class RealtimeVLFWidget(QWidget):
         current_time = datetime.now()
         
         # Add time point
-        if not self.time_data or (current_time - self.time_data[-1]).total_seconds() > 0.1:
-            self.time_data.append(current_time)
+        if self._last_time is None or (current_time - self._last_time).total_seconds() > 0.1:
+            if self._start_time is None:
+                self._start_time = current_time
+            self._last_time = current_time
             
-            # Add amplitude data for each band
-            for band_id in self.amplitude_data. keys():
+            row = [(current_time - self._start_time).total_seconds()]
+            for band_id in BAND_IDS:
                 if band_id in vlf_signals:
                     amplitude = vlf_signals[band_id].amplitude
                 else:
                     amplitude = 0.0
-                
-                self. amplitude_data[band_id]. append(amplitude)
+                row.append(amplitude)
                 
                 # Update current value display
                 if band_id in self.current_values:
                     self.current_values[band_id].setText(f"{band_id}: {amplitude:.3f}")
+            
+            self.samples.append(row)
+            self._dirty = True
         
         # Update data count
-        self.data_count_label.setText(f"Data Points: {len(self.time_data)}")
+        self.data_count_label.setText(f"Data Points: {len(self.samples)}")
+    
+    def flush(self):
+        """Redraw buffered samples; called on the host window's render tick"""
+        self._update_charts()
     
     def _update_charts(self):
         """Update all charts with current data"""
-        if len(self.time_data) < 2:
+        if not self._dirty or len(self.samples) < 2:
             return
+        self._dirty = False
         
         try:
-            # Convert time to seconds relative to first point
-            time_array = np.array([(t - self.time_data[0]).total_seconds() for t in self.time_data])
-            
-            # Update individual band charts
-            for band_id, curve in self.curves.items():
-                if band_id in self.amplitude_data:
-                    amplitude_array = np.array(list(self.amplitude_data[band_id]))
-                    if len(amplitude_array) == len(time_array):
-                        curve.setData(time_array, amplitude_array)
-            
-            # Update overview chart
-            for band_id, curve in self. overview_curves.items():
-                if band_id in self.amplitude_data:
-                    amplitude_array = np.array(list(self.amplitude_data[band_id]))
-                    if len(amplitude_array) == len(time_array):
-                        curve. setData(time_array, amplitude_array)
+            # float64 views into the ring buffer, handed to pyqtgraph as-is
+            time_array = self.samples.view(0)
+            for channel, band_id in enumerate(BAND_IDS, start=1):
+                amplitude_array = self.samples.view(channel)
+                self.curves[band_id].setData(time_array, amplitude_array)
+                self.overview_curves[band_id].setData(time_array, amplitude_array)
                         
         except Exception as e:
             self.logger.debug(f"Chart update error: {e}")
@@ -311,9 +312,10 @@ class RealtimeVLFWidget(QWidget):
     
     def _clear_data(self):
         """Clear all data from charts"""
-        self.time_data.clear()
-        for band_data in self.amplitude_data.values():
-            band_data.clear()
+        self.samples.clear()
+        self._start_time = None
+        self._last_time = None
+        self._dirty = False
         
         # Clear charts
         for curve in self.curves.values():
@@ -8,15 +8,15 @@ from PyQt6.QtWidgets import (
     QProgressBar, QFrame, QPushButton, QTextEdit, QScrollArea,
     QGridLayout, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject
 from PyQt6.QtGui import QFont, QPixmap, QIcon, QPalette, QColor
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
-import asyncio
 
 from core.config_manager import ConfigManager
 from core.logger import get_logger, log_exception
-from api.space_weather_api import SpaceWeatherAPI, SpaceWeatherSummary, SolarFlare
+from gui.styles.dark_theme import DarkTheme
+from api.space_weather_api import get_space_weather_sync, SpaceWeatherSummary, SolarFlare
 
 class SpaceWeatherWorker(QObject):
     """Worker thread for fetching space weather data"""
@@ -30,35 +30,24 @@ class SpaceWeatherWorker(QObject):
         self.logger = get_logger(__name__)
         self.running = False
     
-    async def fetch_data(self):
-        """Fetch space weather data"""
-        try:
-            async with SpaceWeatherAPI(self.config_manager) as api:
-                summary = await api.get_current_conditions()
-                self.data_updated.emit(summary)
-        except Exception as e:
-            log_exception(e, "Space weather data fetch")
-            self.error_occurred. emit(str(e))
-    
     def update_data(self):
         """Update data (called from timer)"""
         if not self.running:
             return
         
+        # Runs on the API's persistent loop, so its session and connections are reused
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.fetch_data())
-            loop.close()
+            summary = get_space_weather_sync(self.config_manager)
+            self.data_updated.emit(summary)
         except Exception as e:
-            log_exception(e, "Space weather worker")
+            log_exception(e, "Space weather data fetch")
             self.error_occurred. emit(str(e))
 
 class StatusIndicator(QLabel):
     """Custom status indicator widget"""
     
     def __init__(self, size: int = 12):
-        super().__init__("●")
+        super().__init__()
         self.setFixedSize(size, size)
         self.setAlignment(Qt. AlignmentFlag.AlignCenter)
         self.set_status("unknown")
@@ -74,7 +63,7 @@ class StatusIndicator(QLabel):
         }
         
         color = colors.get(status.lower(), "#808080")
-        self.setStyleSheet(f"color: {color}; font-size: {self.height()-2}px; font-weight: bold;")
+        self.setPixmap(DarkTheme.dot_pixmap(color, self.height()))
 
 class ParameterDisplay(QFrame):
     """Widget for displaying a single space weather parameter"""
@@ -292,6 +281,9 @@ class SpaceWeatherWidget(QGroupBox):
     
     # Signals
     alert_triggered = pyqtSignal(str, str)  # alert_type, message
+    refresh_requested = pyqtSignal()
+    
+    REFRESH_INTERVAL_MS = 10 * 60 * 1000
     
     def __init__(self, config_manager: ConfigManager, parent: Optional[QWidget] = None):
         super().__init__("Space Weather", parent)
@@ -304,9 +296,8 @@ class SpaceWeatherWidget(QGroupBox):
         self.worker_thread = QThread()
         self.worker. moveToThread(self.worker_thread)
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout. connect(self.worker.update_data)
+        # Queued to the worker thread; the host window's scheduler drives it
+        self.refresh_requested.connect(self.worker.update_data)
         
         # Current data
         self.current_data: Optional[SpaceWeatherSummary] = None
@@ -509,15 +500,11 @@ class SpaceWeatherWidget(QGroupBox):
         # Initial update
         self.manual_refresh()
         
-        # Start timer for regular updates (10 minutes)
-        self.update_timer.start(10 * 60 * 1000)
-        
         self.logger.info("Space weather monitoring started")
     
     def stop_monitoring(self):
         """Stop space weather monitoring"""
         self.worker.running = False
-        self.update_timer.stop()
         self.worker_thread.quit()
         self.worker_thread.wait()
         
@@ -532,12 +519,19 @@ class SpaceWeatherWidget(QGroupBox):
     def toggle_auto_update(self, checked: bool):
         """Toggle automatic updates"""
         if checked:
-            self.update_timer.start(10 * 60 * 1000)
             self.auto_update_button.setText("Auto Update: ON")
         else:
-            self.update_timer.stop()
             self.auto_update_button.setText("Auto Update: OFF")
     
+    def periodic_tasks(self):
+        """(period_ms, callback) pairs for the host window's scheduler"""
+        return ((self.REFRESH_INTERVAL_MS, self._auto_refresh),)
+    
+    def _auto_refresh(self):
+        """Fetch new data on the worker thread while auto update is on"""
+        if self.auto_update_button.isChecked():
+            self.refresh_requested.emit()
+    
     def update_display(self, summary: SpaceWeatherSummary):
         """Update display with new space weather data"""
         self.current_data = summary
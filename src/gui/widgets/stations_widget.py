@@ -17,6 +17,7 @@ import xml.etree.ElementTree as ET
 
 from core.config_manager import ConfigManager, VLFStation
 from core.logger import get_logger
+from gui.styles.dark_theme import DarkTheme
 
 class StationItem(QWidget):
     """Custom widget for displaying VLF station information"""
@@ -91,8 +92,8 @@ class StationItem(QWidget):
         layout.addStretch()
         
         # Signal strength indicator (placeholder for future)
-        self.signal_indicator = QLabel("●")
-        self.signal_indicator.setStyleSheet("color: #404040; font-size: 16px;")
+        self.signal_indicator = QLabel()
+        self.signal_indicator.setPixmap(DarkTheme.dot_pixmap("#404040"))
         self.signal_indicator.setToolTip("Signal strength indicator")
         layout.addWidget(self. signal_indicator)
         
@@ -156,7 +157,7 @@ class StationItem(QWidget):
         else:
             color = "#ff0000"  # Very weak/no signal - red
         
-        self.signal_indicator.setStyleSheet(f"color: {color}; font-size: 16px;")
+        self.signal_indicator.setPixmap(DarkTheme.dot_pixmap(color))
 
 class StationEditDialog(QDialog):
     """Dialog for editing VLF station properties"""
@@ -5,62 +5,169 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.requests import Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
 import asyncio
+import hashlib
+import importlib.util
 import json
+import threading
+import time
+import zlib
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Optional, Union
 import uvicorn
+import orjson
 from pathlib import Path
-from core.audio_manager import AudioManager
-from core.vlf_system import VLFMonitoringSystem
-from core.vlf_processor import VLFSignal
 from core.config_manager import ConfigManager
 from data.realtime_storage import RealtimeStorage
 from core.logger import get_logger
 from core.space_weather import SpaceWeatherAPI
-from core.vlf_audio_processor import VLFAudioProcessor
-import pyaudio
-import numpy as np
+
+# numpy, PyAudio, the DSP pipeline and the numba kernels are imported where
+# they are first needed so /setup and /api/config do not pay for them
+if TYPE_CHECKING:
+    import numpy as np
+    from core.audio_manager import AudioManager, AudioRingBuffer
+    from core.vlf_audio_processor import VLFAudioProcessor
+    from core.vlf_processor import VLFSignal
+
+def _event_loop_impl() -> str:
+    """Pick uvloop when it is installed (not available on Windows)"""
+    try:
+        import uvloop  # noqa: F401
+        return "uvloop"
+    except ImportError:
+        return "asyncio"
+
+def _protocol_impl(module: str) -> str:
+    """Use a protocol implementation only when it is installed, else let uvicorn choose"""
+    return module if importlib.util.find_spec(module) is not None else "auto"
+
+def _warmup_sim_kernels():
+    """Import and JIT-compile the simulator kernels"""
+    from core.sim_kernels import warmup
+    warmup()
+
+def _put_drop_oldest(queue: asyncio.Queue, item: Union[Dict, bytes, str]):
+    """Put without waiting; when the queue is full, discard its oldest item first"""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(item)
+
+def _build_signal_packer(bands):
+    """Generate a function that packs per-band value lists into the broadcast signals dict
+    
+    The band list is fixed between config changes, so the keys and indices are
+    baked into a dict literal instead of being inserted one by one per tick.
+    """
+    lines = ["def pack(freq, amp, phase):", "    return {"]
+    for i, band in enumerate(bands):
+        lines.append(f"        {band!r}: {{'frequency': freq[{i}], 'amplitude': amp[{i}], 'phase': phase[{i}]}},")
+    lines.append("    }")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["pack"]
 
 class VLFWebAPI:
     """Web API for VLF monitoring system"""
     
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
-        self. audio_manager = AudioManager()
+        self._audio_manager: Optional["AudioManager"] = None
         self.logger = get_logger(__name__)
         
         self.app = FastAPI(
             title="SuperSID Pro Web API",
             description="Real-time VLF monitoring web interface",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
 
         web_path = Path("src/web")
         
-        self.vlf_audio_processor = VLFAudioProcessor(config_manager)
+        self._vlf_audio_processor: Optional["VLFAudioProcessor"] = None
         self.audio_stream = None
+        self._audio_ring: Optional["AudioRingBuffer"] = None
+        self._audio_consumer_thread = None
 
         self.use_real_hardware = False
 
         self.app.mount("/static", StaticFiles(directory=web_path / "static"), name="static")
         self.templates = Jinja2Templates(directory=web_path / "templates")
         
-        self.websocket_connections:  List[WebSocket] = []
+        # Each client has its own bounded send queue drained by a sender task
+        self.websocket_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._client_queue_size = 100
+        self._compress_min_bytes = 1024
         
         self.vlf_system = None
         self.storage = RealtimeStorage()
         self._monitoring_task = None
+        self._main_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._main_loop_thread_id: Optional[int] = None
+        self._broadcast_queue: Optional[asyncio.Queue] = None
+        self._broadcaster_task = None
+        self._warmup_task = None
+        self._broadcast_batch_max = 32
+        self._broadcast_batch_window = 0.02
+        self._config_lock = asyncio.Lock()
+        
+        # Struct-of-arrays buffers reused by the simulator, built when it starts
+        self._rng = None
+        self._sim_stations = ()
+        self._first_run = self.config_manager.is_first_run()
+        self._config_bytes: Optional[bytes] = None
+        self._config_etag: Optional[str] = None
         
         self.space_weather = SpaceWeatherAPI(self.config_manager)
+        self._sw_cache_ttl = 5.0
+        self._sw_cache = {"data": None, "summary": None, "ts": 0.0}
         
         self._setup_routes()
         
         self.logger.info("VLF Web API initialized")
     
+    @property
+    def audio_manager(self) -> "AudioManager":
+        """Audio device manager, created on first use (initializes PortAudio)"""
+        if self._audio_manager is None:
+            from core.audio_manager import AudioManager
+            self._audio_manager = AudioManager()
+        return self._audio_manager
+    
+    @property
+    def vlf_audio_processor(self) -> "VLFAudioProcessor":
+        """VLF audio processor, created on first use"""
+        if self._vlf_audio_processor is None:
+            from core.vlf_audio_processor import VLFAudioProcessor
+            self._vlf_audio_processor = VLFAudioProcessor(self.config_manager)
+        return self._vlf_audio_processor
+    
+    def _invalidate_config_cache(self):
+        """Drop the serialized /api/config payload after the config changes"""
+        self._config_bytes = None
+        self._config_etag = None
+    
+    def _get_space_weather_cached(self) -> Dict:
+        """Get space weather data and summary, recomputed at most once per TTL"""
+        now = time.monotonic()
+        if now - self._sw_cache["ts"] > self._sw_cache_ttl:
+            self._sw_cache.update(
+                data=self.space_weather.get_latest_data(),
+                summary=self.space_weather.get_summary(),
+                ts=now
+            )
+        return self._sw_cache
+    
     def start_real_audio_capture(self, device_index: int, sample_rate: int, buffer_size: int):
         """Start capturing real audio from radio telescope"""
+        import numpy as np
+        import pyaudio
+        from core.audio_manager import AudioRingBuffer
+        
         try:
             self.logger.info(f"Starting real audio capture from device {device_index}")
         
@@ -69,15 +176,12 @@ class VLFWebAPI:
                 anomaly_callback=self._on_anomaly
             )
 
+            ring = AudioRingBuffer(buffer_size * 16)
+            self._audio_ring = ring
+
+            # Runs on PortAudio's real-time thread: copy samples and return
             def audio_callback(in_data, frame_count, time_info, status):
-                if self.vlf_audio_processor.is_processing:
-                    audio_array = np.frombuffer(in_data, dtype=np.float32)
-                    
-                    vlf_signals = self.vlf_audio_processor.process_audio_buffer(audio_array)
-                    
-                    if vlf_signals:
-                        self._on_vlf_data(vlf_signals)
-                        
+                ring.write(np.frombuffer(in_data, dtype=np.int16))
                 return (None, pyaudio.paContinue)
         
             self.audio_stream = self.audio_manager.start_recording(
@@ -89,6 +193,10 @@ class VLFWebAPI:
             
             if self.audio_stream:
                 self.vlf_audio_processor.start_processing()
+                self._audio_consumer_thread = threading.Thread(
+                    target=self._audio_consumer, args=(ring, buffer_size), daemon=True
+                )
+                self._audio_consumer_thread.start()
                 self.use_real_hardware = True
                 self.logger.info("Real audio capture started successfully")
                 return True
@@ -99,6 +207,27 @@ class VLFWebAPI:
             self.logger.error(f"Failed to start real audio capture: {e}")
             return False
 
+    def _audio_consumer(self, ring: "AudioRingBuffer", block_size: int):
+        """Pull fixed-size blocks from the capture ring and run VLF processing"""
+        import numpy as np
+        
+        while self.vlf_audio_processor.is_processing:
+            block = ring.read(block_size, timeout=0.5)
+            if block is None:
+                continue
+            
+            try:
+                audio_array = block.astype(np.float32) / 32768.0
+                vlf_signals = self.vlf_audio_processor.process_audio_buffer(audio_array)
+                
+                if vlf_signals:
+                    self._on_vlf_data(vlf_signals)
+            except Exception as e:
+                self.logger.error(f"Audio processing error: {e}")
+        
+        if ring.overruns:
+            self.logger.warning(f"Audio ring buffer overran {ring.overruns} times")
+
     def stop_real_audio_capture(self):
         """Stop real audio capture"""
         try:
@@ -106,7 +235,12 @@ class VLFWebAPI:
                 self.audio_manager.stop_recording()
                 self.audio_stream = None
             
-            self.vlf_audio_processor. stop_processing()
+            if self._vlf_audio_processor:
+                self._vlf_audio_processor.stop_processing()
+            if self._audio_consumer_thread:
+                self._audio_consumer_thread.join(timeout=2.0)
+                self._audio_consumer_thread = None
+            self._audio_ring = None
             self.use_real_hardware = False
             self.logger.info("Real audio capture stopped")
             
@@ -116,25 +250,52 @@ class VLFWebAPI:
     def _setup_routes(self):
         """Setup API routes"""
         
+        @self.app.on_event("startup")
+        async def on_startup():
+            """Start the broadcast consumer and compile the simulator kernel"""
+            self._main_loop = asyncio.get_running_loop()
+            self._main_loop_thread_id = threading.get_ident()
+            self._broadcast_queue = asyncio.Queue(maxsize=1000)
+            self._broadcaster_task = asyncio.create_task(self._broadcast_consumer())
+            # Compile in the background so serving does not wait on numba
+            self._warmup_task = asyncio.create_task(asyncio.to_thread(_warmup_sim_kernels))
+        
+        @self.app.on_event("shutdown")
+        async def on_shutdown():
+            """Stop the broadcast consumer task"""
+            self._main_loop = None
+            self._main_loop_thread_id = None
+            if self._broadcaster_task:
+                self._broadcaster_task.cancel()
+                self._broadcaster_task = None
+        
         @self.app.get("/", response_class=HTMLResponse)
         async def dashboard(request: Request):
             """Main dashboard page"""
-            if self.config_manager.config.get("application", {}).get("first_run", True):
+            if self._first_run:
                 return RedirectResponse(url="/setup")
             
             return self.templates.TemplateResponse("dashboard.html", {"request": request})
         
         @self.app.get("/api/config")
-        async def get_config():
+        async def get_config(request: Request):
             """Get observatory configuration"""
             try:
-                config = self.config_manager.config
-                return {
-                    "status": "ok",
-                    "observatory": config.get("observatory", {}),
-                    "vlf_stations": config.get("vlf_stations", {}),
-                    "application": config.get("application", {})
-                    }
+                if self._config_bytes is None:
+                    config = self.config_manager.config
+                    self._config_bytes = orjson.dumps({
+                        "status": "ok",
+                        "observatory": config.get("observatory", {}),
+                        "vlf_stations": config.get("vlf_stations", {}),
+                        "application": config.get("application", {})
+                        })
+                    # Content hash, so the tag stays valid across restarts and external edits
+                    self._config_etag = f'"{hashlib.blake2b(self._config_bytes, digest_size=8).hexdigest()}"'
+                
+                etag = self._config_etag
+                if request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304, headers={"ETag": etag})
+                return Response(self._config_bytes, media_type="application/json", headers={"ETag": etag})
             except Exception as e: 
                 raise HTTPException(status_code=500, detail=str(e))
 
@@ -178,76 +339,71 @@ class VLFWebAPI:
         async def save_setup(setup_data: dict):
             """Save observatory setup configuration"""
             try:
-                current_config = self.config_manager.config.copy()
-                
-                if 'observatory' in setup_data:
-                    current_config['observatory'] = {
-                        **current_config. get('observatory', {}),
-                        **setup_data['observatory']
-                    }
-                
-                if 'vlf_stations' in setup_data:
-                    current_config['vlf_stations'] = {
-                        **current_config.get('vlf_stations', {}),
-                        **setup_data['vlf_stations']
-                    }
-                
-                if 'application' in setup_data:
-                    current_config['application'] = {
-                        **current_config.get('application', {}),
-                        **setup_data['application']
-                    }
-                
-                if 'space_weather' not in current_config:
-                    current_config['space_weather'] = {
-                        "enable_spaceweatherlive": True,
-                        "enable_swpc_noaa": True,
-                        "update_interval": 600
-                    }
+                async with self._config_lock:
+                    live_config = self.config_manager.config
+                    current_config = dict(live_config)
+                    
+                    for section in ('observatory', 'vlf_stations', 'application'):
+                        if section in setup_data:
+                            current_config[section] = {
+                                **live_config.get(section, {}),
+                                **setup_data[section]
+                            }
+                    
+                    if 'space_weather' not in current_config:
+                        current_config['space_weather'] = {
+                            "enable_spaceweatherlive": True,
+                            "enable_swpc_noaa": True,
+                            "update_interval": 600
+                        }
                 
-                if 'data_sources' not in current_config: 
-                    current_config['data_sources'] = {
-                        "audio":  {
-                            "enabled": True,
-                            "sample_rate": 11025,
-                            "buffer_size": 1024
-                        },
-                        "simulation": {
-                            "enabled":  True,
-                            "frequencies": [24.0, 19.8, 23.4, 19.6],
-                            "amplitude_range": [0.001, 0.01]
+                    if 'data_sources' not in current_config: 
+                        current_config['data_sources'] = {
+                            "audio":  {
+                                "enabled": True,
+                                "sample_rate": 11025,
+                                "buffer_size": 1024
+                            },
+                            "simulation": {
+                                "enabled":  True,
+                                "frequencies": [24.0, 19.8, 23.4, 19.6],
+                                "amplitude_range": [0.001, 0.01]
+                            }
                         }
-                    }
                 
-                if 'vlf_system' not in current_config:
-                    current_config['vlf_system'] = {
-                        "audio_sample_rate": 11025,
-                        "audio_buffer_size": 1024,
-                        "audio_device":  None,
-                        "storage_batch_size": 10,
-                        "anomaly_detection":  True,
-                        "baseline_update_interval": 300
-                    }
+                    if 'vlf_system' not in current_config:
+                        current_config['vlf_system'] = {
+                            "audio_sample_rate": 11025,
+                            "audio_buffer_size": 1024,
+                            "audio_device":  None,
+                            "storage_batch_size": 10,
+                            "anomaly_detection":  True,
+                            "baseline_update_interval": 300
+                        }
                 
-                if 'monitoring' not in current_config:
-                    current_config['monitoring'] = {
-                        "auto_start": True,
-                        "data_retention_days": 30,
-                        "export_format": "csv",
-                        "screenshot_interval": 300
-                    }
+                    if 'monitoring' not in current_config:
+                        current_config['monitoring'] = {
+                            "auto_start": True,
+                            "data_retention_days": 30,
+                            "export_format": "csv",
+                            "screenshot_interval": 300
+                        }
                 
-                if 'reporting' not in current_config: 
-                    current_config['reporting'] = {
-                        "ftp_upload":  False,
-                        "ftp_server": "sid-ftp.stanford.edu",
-                        "ftp_directory": "/incoming/SuperSID/NEW/",
-                        "local_tmp":  "/tmp",
-                        "report_interval": 86400
-                    }
+                    if 'reporting' not in current_config: 
+                        current_config['reporting'] = {
+                            "ftp_upload":  False,
+                            "ftp_server": "sid-ftp.stanford.edu",
+                            "ftp_directory": "/incoming/SuperSID/NEW/",
+                            "local_tmp":  "/tmp",
+                            "report_interval": 86400
+                        }
                 
-                self.config_manager.config = current_config
-                self.config_manager.save_config()
+                    self.config_manager.config = current_config
+                    await asyncio.to_thread(self.config_manager.save_config)
+                    self._invalidate_config_cache()
+                    if self._monitoring_task:
+                        self._refresh_sim_config()
+                    self._first_run = self.config_manager.is_first_run()
                 
                 return {"status": "success", "message":  "Observatory configuration saved successfully"}
                 
@@ -274,13 +430,12 @@ class VLFWebAPI:
         async def get_space_weather():
             """Get current space weather data"""
             try:
-                data = self.space_weather.get_latest_data()
-                summary = self.space_weather.get_summary()
+                cache = self._get_space_weather_cached()
                 
                 return {
                     "status": "ok",
-                    "data":  data,
-                    "summary":  summary,
+                    "data":  cache["data"],
+                    "summary":  cache["summary"],
                     "timestamp":  datetime.now(timezone.utc).isoformat()
                 }
             except Exception as e: 
@@ -290,8 +445,7 @@ class VLFWebAPI:
         async def get_space_weather_summary():
             """Get space weather summary"""
             try:
-                summary = self.space_weather.get_summary()
-                return summary
+                return self._get_space_weather_cached()["summary"]
             except Exception as e: 
                 raise HTTPException(status_code=500, detail=str(e))
 
@@ -301,8 +455,10 @@ class VLFWebAPI:
             try:
                 self.logger.info("Forcing space weather update...")
                 await self.space_weather.fetch_all_data()
-                data = self.space_weather.get_latest_data()
-                summary = self.space_weather.get_summary()
+                self._sw_cache["ts"] = 0.0
+                cache = self._get_space_weather_cached()
+                data = cache["data"]
+                summary = cache["summary"]
                 
                 return {
                     "status": "updated",
@@ -333,6 +489,7 @@ class VLFWebAPI:
                 self.logger.info("USING SIMULATION MODE - hardware audio has issues")
 
                 if not self.vlf_system:
+                    from core.vlf_system import VLFMonitoringSystem
                     self.vlf_system = VLFMonitoringSystem(self.config_manager)
                     self.vlf_system.register_data_callback(self._on_vlf_data)
                     self.vlf_system.register_anomaly_callback(self._on_anomaly)
@@ -345,6 +502,7 @@ class VLFWebAPI:
                     #buffer_size = audio_config.get('audio_buffer_size', 4096)
 
                 if not self._monitoring_task:
+                    self._refresh_sim_config()
                     self._monitoring_task = asyncio.create_task(self._simulation_loop())
 
                     #success = self.start_real_audio_capture(audio_device, sample_rate, buffer_size)
@@ -405,18 +563,19 @@ class VLFWebAPI:
                 sample_rate = device_data.get('sample_rate', 44100)
                 buffer_size = device_data.get('buffer_size', 4096)
         
-                current_config = self.config_manager.config.copy()
-                if 'vlf_system' not in current_config:
-                    current_config['vlf_system'] = {}
-        
-                current_config['vlf_system']. update({
-                    'audio_device': device_index,
-                    'audio_sample_rate': sample_rate,
-                    'audio_buffer_size': buffer_size
-                })
+                async with self._config_lock:
+                    live_config = self.config_manager.config
+                    current_config = dict(live_config)
+                    current_config['vlf_system'] = {
+                        **live_config.get('vlf_system', {}),
+                        'audio_device': device_index,
+                        'audio_sample_rate': sample_rate,
+                        'audio_buffer_size': buffer_size
+                    }
         
-                self.config_manager.config = current_config
-                self.config_manager.save_config()
+                    self.config_manager.config = current_config
+                    await asyncio.to_thread(self.config_manager.save_config)
+                    self._invalidate_config_cache()
         
                 return {
                     "status": "success",
@@ -433,7 +592,7 @@ class VLFWebAPI:
         async def get_recent_data(station: str, minutes: int = 60):
             """Get recent data for a station"""
             try:
-                measurements = self.storage.get_recent_data(station, minutes)
+                measurements = await asyncio.to_thread(self.storage.get_recent_data, station, minutes)
                 
                 data = []
                 for measurement in measurements:
@@ -457,7 +616,6 @@ class VLFWebAPI:
         async def websocket_endpoint(websocket: WebSocket):
             """WebSocket endpoint for real-time data"""
             await websocket.accept()
-            self.websocket_connections.append(websocket)
             
             welcome_msg = {
                 "type": "connection",
@@ -466,132 +624,249 @@ class VLFWebAPI:
             }
             await websocket.send_text(json.dumps(welcome_msg))
             
+            queue = asyncio.Queue(maxsize=self._client_queue_size)
+            self.websocket_connections[websocket] = queue
+            sender = asyncio.create_task(self._websocket_sender(websocket, queue))
+            
             try: 
                 while True:
                     message = await websocket.receive_text()
                     if message == "ping":
-                        await websocket. send_text("pong")
+                        _put_drop_oldest(queue, "pong")
                     
             except WebSocketDisconnect: 
-                self.websocket_connections.remove(websocket)
+                pass
+            finally:
+                self.websocket_connections.pop(websocket, None)
+                sender.cancel()
     
     async def _simulation_loop(self):
         """Simulation loop for demo data (remove when using real hardware)"""
+        import numpy as np
+        from core.sim_kernels import NUMBA_AVAILABLE, fill_signals
+        
+        loop = asyncio.get_running_loop()
+        tick_interval = 1.0
+        next_tick = loop.time() + tick_interval
+        
         while True:
             try: 
-                current_time = datetime.now(timezone.utc)
-                t = current_time.timestamp()
+                t = time.time()
                 
-                stations = self.config_manager.config.get('vlf_stations', {}).get('monitored_stations', ['NPM', 'GQD', 'DHO38', 'NAA'])
-                station_freqs = self.config_manager.config.get('vlf_stations', {}).get('station_frequencies', {})
+                n = len(self._sim_stations)
                 
-                vlf_signals = {}
+                # All stations in one pass: harmonic k = i + 1 per station
+                k = self._sim_harmonics
+                noise = self._rng.standard_normal(n)
+                if NUMBA_AVAILABLE:
+                    fill_signals(t, self._sim_base_freqs, self._sim_base_amp, k, noise, self._sim_freq, self._sim_amp)
+                else:
+                    self._sim_amp[:] = np.abs(self._sim_base_amp + 0.0005 * np.sin(t * 0.1 * k) + 0.0001 * noise)
+                    self._sim_freq[:] = self._sim_base_freqs + 0.05 * np.sin(t * 0.05 * k)
                 
-                for i, station in enumerate(stations):
-                    band = f'BAND_{i + 1}'
-                    station_info = station_freqs.get(station, {})
-                    base_freq = station_info.get('freq', 20.0 + i * 2)
-                    
-                    base_amplitude = 0.001 * (i + 1)
-                    variation = 0.0005 * np.sin(t * 0.1 * (i + 1)) + 0.0001 * np.random.randn()
-                    amplitude = base_amplitude + variation
-                    
-                    freq_variation = 0.05 * np.sin(t * 0.05 * (i + 1))
-                    frequency = base_freq + freq_variation
-                    
-                    signal = VLFSignal(
-                        timestamp=current_time. timestamp(),
-                        frequency=frequency,
-                        amplitude=abs(amplitude),
-                        phase=0.0,
-                        station_id=band
-                    )
-                    
-                    vlf_signals[band] = signal
+                self._on_vlf_data_arrays(self._sim_freq, self._sim_amp, self._sim_phase)
                 
-                self._on_vlf_data(vlf_signals)
-                
-                if np.random. random() < 0.01:
-                    random_station_idx = np.random.randint(0, len(stations))
+                if self._rng.random() < 0.01:
+                    random_station_idx = int(self._rng.integers(0, n))
                     anomalies = [f"BAND_{random_station_idx + 1}: Signal amplitude spike detected"]
-                    self._on_anomaly(anomalies, current_time)
+                    self._on_anomaly(anomalies, datetime.fromtimestamp(t, timezone.utc))
                 
-                await asyncio.sleep(1.0)
+                # Sleep against a monotonic baseline so the body's cost does not
+                # accumulate as drift; if the body overran, catch up without sleeping
+                delay = next_tick - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_tick += tick_interval
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Simulation error: {e}")
                 await asyncio.sleep(5.0)
+                next_tick = loop.time() + tick_interval
 
-    def _on_vlf_data(self, vlf_signals:  Dict[str, VLFSignal]):
+    def _refresh_sim_config(self):
+        """Read the monitored stations from config and rebuild the simulator's arrays"""
+        import numpy as np
+        
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        
+        vlf_stations = self.config_manager.config.get('vlf_stations', {})
+        stations = vlf_stations.get('monitored_stations', ['NPM', 'GQD', 'DHO38', 'NAA'])
+        station_freqs = vlf_stations.get('station_frequencies', {})
+        
+        n = len(stations)
+        self._sim_stations = tuple(f'BAND_{i + 1}' for i in range(n))
+        self._pack_signals = _build_signal_packer(self._sim_stations)
+        self._sim_base_freqs = np.array([
+            station_freqs.get(station, {}).get('freq', 20.0 + i * 2)
+            for i, station in enumerate(stations)
+        ], dtype=np.float64)
+        self._sim_harmonics = np.arange(1, n + 1, dtype=np.float64)
+        self._sim_base_amp = 0.001 * self._sim_harmonics
+        self._sim_freq = np.zeros(n)
+        self._sim_amp = np.zeros(n)
+        self._sim_phase = np.zeros(n)
+
+    def _on_vlf_data(self, vlf_signals:  Dict[str, "VLFSignal"]):
         """Handle VLF data callback - Thread-safe WebSocket broadcasting"""
+        import numpy as np
+        
         try:
+            # Pack every signal into one (N, 3) array so non-finite values are
+            # zeroed in a single vectorized pass
+            values = np.array(
+                [(signal.frequency, signal.amplitude, signal.phase) for signal in vlf_signals.values()],
+                dtype=np.float64
+            ).reshape(-1, 3)
+            values[~np.isfinite(values)] = 0.0
+            
+            # The broadcast consumer stamps the timestamp once per batch
             data = {
                 "type": "vlf_data", 
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "signals": {}
-            }
-            
-            for station, signal in vlf_signals.items():
-                data["signals"][station] = {
-                    "frequency": float(signal.frequency) if np.isfinite(signal.frequency) else 0.0,
-                    "amplitude": float(signal.amplitude) if np.isfinite(signal.amplitude) else 0.0,
-                    "phase": float(signal.phase) if np.isfinite(signal.phase) else 0.0
+                "signals": {
+                    station: {"frequency": f, "amplitude": a, "phase": p}
+                    for station, (f, a, p) in zip(vlf_signals, values.tolist())
                 }
+            }
             
-            if hasattr(self, '_broadcast_queue'):
-                self._broadcast_queue.put(data)
-            else:
-                import threading
-                threading.Thread(target=self._safe_broadcast, args=(data,), daemon=True).start()
+            self._publish(data)
                 
         except Exception as e: 
             self.logger.error(f"Error handling VLF data: {e}")
 
-    def _safe_broadcast(self, data):
-        """Thread-safe WebSocket broadcast"""
+    def _on_vlf_data_arrays(self, freq: "np.ndarray", amp: "np.ndarray", phase: "np.ndarray"):
+        """Handle simulator data packed as struct-of-arrays, without building VLFSignal objects"""
+        import numpy as np
+        
         try:
-            loop = asyncio.new_event_loop() 
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._broadcast_to_websockets(data))
+            freq = np.where(np.isfinite(freq), freq, 0.0)
+            amp = np.where(np.isfinite(amp), amp, 0.0)
+            phase = np.where(np.isfinite(phase), phase, 0.0)
+            
+            data = {
+                "type": "vlf_data",
+                "signals": self._pack_signals(freq.tolist(), amp.tolist(), phase.tolist())
+            }
+            
+            self._publish(data)
+            
         except Exception as e:
-            self.logger.error(f"Broadcast error: {e}")
-        finally:
-            loop.close()
+            self.logger.error(f"Error handling VLF data: {e}")
+
+    def _publish(self, data: Dict):
+        """Hand a message to the broadcast consumer - safe to call from any thread"""
+        loop = self._main_loop
+        if loop is None:
+            return
+        
+        if threading.get_ident() == self._main_loop_thread_id:
+            self._enqueue_broadcast(data)
+            return
+        
+        try:
+            loop.call_soon_threadsafe(self._enqueue_broadcast, data)
+        except RuntimeError:
+            # Loop closed between the check and the call (server shutting down)
+            pass
+
+    def _enqueue_broadcast(self, data: Dict):
+        """Queue a message on the event loop, dropping the oldest one if the queue is full"""
+        _put_drop_oldest(self._broadcast_queue, data)
+
+    async def _broadcast_consumer(self):
+        """Drain the broadcast queue and push messages to the WebSocket clients in batches"""
+        loop = asyncio.get_running_loop()
+        queue = self._broadcast_queue
+        
+        while True:
+            batch = [await queue.get()]
+            
+            # Collect whatever else arrives within the batch window, capped in size
+            deadline = loop.time() + self._broadcast_batch_window
+            while len(batch) < self._broadcast_batch_max:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # One clock read and ISO format per batch, shared by every message lacking its own
+            timestamp = datetime.now(timezone.utc).isoformat()
+            for item in batch:
+                if "timestamp" not in item:
+                    item["timestamp"] = timestamp
+            
+            data = batch[0] if len(batch) == 1 else {"type": "vlf_batch", "timestamp": timestamp, "items": batch}
+            try:
+                await self._broadcast_to_websockets(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Broadcast error: {e}")
 
     def _on_anomaly(self, anomalies: List[str], timestamp):
-        """Handle anomaly callback"""
+        """Handle anomaly callback - may be called from any thread"""
         data = {
             "type": "anomaly",
             "timestamp": timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp),
             "anomalies": anomalies
         }
         
-        asyncio.create_task(self._broadcast_to_websockets(data))
+        self._publish(data)
     
     async def _broadcast_to_websockets(self, data: Dict):
         """Broadcast data to all WebSocket connections"""
         if not self.websocket_connections:
             return
         
-        message = json.dumps(data)
+        # Encode once; every client gets the same UTF-8 bytes as a binary frame.
+        # Hand-off is non-blocking: a slow client only loses its own oldest messages
+        payload = orjson.dumps(data)
         
-        disconnected = []
-        for websocket in self.websocket_connections:
-            try: 
-                await websocket.send_text(message)
-            except: 
-                disconnected.append(websocket)
+        # Large payloads are deflated once here instead of once per connection by the
+        # server; clients tell them apart by the zlib header byte (0x78 vs '{')
+        if len(payload) >= self._compress_min_bytes:
+            payload = zlib.compress(payload, 6)
         
-        for websocket in disconnected:
-            if websocket in self.websocket_connections:
-                self.websocket_connections.remove(websocket)
+        for queue in self.websocket_connections.values():
+            _put_drop_oldest(queue, payload)
+    
+    async def _websocket_sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one client's send queue"""
+        try:
+            while True:
+                message = await queue.get()
+                if isinstance(message, bytes):
+                    await websocket.send_bytes(message)
+                else:
+                    await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.websocket_connections.pop(websocket, None)
     
     def run(self, host: str = "0.0.0.0", port: int = 8000, debug: bool = False):
         """Run the web server"""
         self.logger.info(f"Starting VLF Web API on {host}:{port}")
-        uvicorn.run(self.app, host=host, port=port, debug=debug)
+        uvicorn.run(
+            self.app,
+            host=host,
+            port=port,
+            loop=_event_loop_impl(),
+            http=_protocol_impl("httptools"),
+            ws=_protocol_impl("websockets"),
+            ws_per_message_deflate=False,
+            access_log=debug,
+            log_level="debug" if debug else "info",
+            proxy_headers=False
+        )
 
 def create_vlf_web_api(config_path: str = "config/default_config.json") -> VLFWebAPI:
     """Factory function to create VLF Web API"""
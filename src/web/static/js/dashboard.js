@@ -47,6 +47,8 @@ class VLFDashboard {
         console.log('Connecting to WebSocket:', wsUrl);
         
         this.websocket = new WebSocket(wsUrl);
+        this.websocket.binaryType = 'arraybuffer';
+        this.textDecoder = new TextDecoder();
         
         this.websocket.onopen = () => {
             console. log('WebSocket connected successfully! ');
@@ -54,17 +56,23 @@ class VLFDashboard {
             this.enableControls(true);
         };
         
+        this.messageChain = Promise.resolve();
+        
         this.websocket.onmessage = (event) => {
-            try {
-                const data = JSON. parse(event.data);
-                console.log('Received message:', data. type);
-                
-                if (data.type === 'vlf_data') {
-                    this.handleVLFData(data);
-                }
-            } catch (error) {
-                console.error('Error parsing message:', error);
-            }
+            // Chain decodes so messages are handled in arrival order
+            this.messageChain = this.messageChain
+                .then(() => this.decodeMessage(event.data))
+                .then(text => {
+                    const data = JSON. parse(text);
+                    console.log('Received message:', data. type);
+                    
+                    if (data.type === 'vlf_batch') {
+                        data.items.forEach(item => this.handleMessage(item));
+                    } else {
+                        this.handleMessage(data);
+                    }
+                })
+                .catch(error => console.error('Error parsing message:', error));
         };
         
         this.websocket.onclose = () => {
@@ -81,6 +89,23 @@ class VLFDashboard {
         };
     }
     
+    async decodeMessage(payload) {
+        if (typeof payload === 'string') return payload;
+        const bytes = new Uint8Array(payload);
+        // Large broadcasts arrive zlib-compressed (0x78 header) instead of plain JSON
+        if (bytes[0] === 0x78) {
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+            return await new Response(stream).text();
+        }
+        return this.textDecoder.decode(bytes);
+    }
+    
+    handleMessage(data) {
+        if (data.type === 'vlf_data') {
+            this.handleVLFData(data);
+        }
+    }
+    
     handleVLFData(data) {
         console.log('Processing VLF data.. .');
         
@@ -0,0 +1,66 @@
+"""
+Unit tests for ConfigManager dot-notation access
+"""
+import pytest
+
+from core.config_manager import ConfigManager
+
+@pytest.fixture
+def config(temp_dir):
+    """ConfigManager backed by a fresh file in a temporary directory"""
+    return ConfigManager(str(temp_dir / "config.json"))
+
+def test_set_replaces_subtree(config):
+    """Keys under a replaced section no longer resolve"""
+    config.set("test_section", {"old": 1, "nested": {"deep": 2}}, auto_save=False)
+    assert config.get("test_section.nested.deep") == 2
+    
+    config.set("test_section", {"new": 3}, auto_save=False)
+    
+    assert config.get("test_section.old") is None
+    assert config.get("test_section.nested.deep", "missing") == "missing"
+    assert config.get("test_section.new") == 3
+    assert config.get("test_section") == {"new": 3}
+
+def test_set_creates_missing_sections(config):
+    """Setting a new nested key makes its parent sections readable"""
+    config.set("alpha.beta.gamma", 42, auto_save=False)
+    
+    assert config.get("alpha.beta.gamma") == 42
+    assert config.get("alpha.beta") == {"gamma": 42}
+    assert config.get("alpha") == {"beta": {"gamma": 42}}
+    assert config.config["alpha"]["beta"]["gamma"] == 42
+
+def test_set_leaf_updates_parent_view(config):
+    """A parent section read through get() reflects later leaf updates"""
+    config.set("section", {"a": 1, "b": 2}, auto_save=False)
+    config.set("section.a", 10, auto_save=False)
+    
+    assert config.get("section.a") == 10
+    assert config.get("section") == {"a": 10, "b": 2}
+    assert config.get("section.b") == 2
+
+def test_reassigning_config_rebuilds_index(config):
+    """Replacing the whole tree drops keys that are no longer present"""
+    config.set("gone.key", 1, auto_save=False)
+    config.config = {"kept": {"key": 2}}
+    
+    assert config.get("gone.key") is None
+    assert config.get("kept.key") == 2
+
+def test_first_run_marker(config):
+    """The marker file ends first-run mode even if the config still says first_run"""
+    config.set("application.first_run", True, auto_save=False)
+    assert config.is_first_run()
+    
+    config.mark_first_run_done()
+    
+    assert config.first_run_marker.exists()
+    assert not config.is_first_run()
+
+def test_first_run_false_in_config_counts_as_done(config):
+    """Configs saved by the web setup (first_run=false) need no marker"""
+    config.set("application.first_run", False, auto_save=False)
+    
+    assert not config.first_run_marker.exists()
+    assert not config.is_first_run()
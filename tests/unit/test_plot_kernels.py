@@ -0,0 +1,76 @@
+"""
+Unit tests for the chart downsampling kernels
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.plot_kernels import lttb, m4_indices, downsample_m4
+
+def _trace(n, seed=0):
+    rng = np.random.default_rng(seed)
+    ts = np.arange(n, dtype=np.int64) * 100
+    amp = rng.standard_normal(n).astype(np.float32)
+    return ts, amp
+
+@pytest.mark.parametrize("n, n_out", [(1000, 100), (1000, 3), (50, 49)])
+def test_lttb_keeps_endpoints_and_length(n, n_out):
+    """Output has `n_out` rows and starts/ends on the original endpoints"""
+    ts, amp = _trace(n)
+    out = lttb(ts, amp, n_out)
+    
+    assert out.shape == (n_out, 2)
+    assert out[0].tolist() == [ts[0], amp[0]]
+    assert out[-1].tolist() == [ts[-1], amp[-1]]
+
+def test_lttb_output_is_time_ordered_subset():
+    """Every picked point is an original sample, in increasing time order"""
+    ts, amp = _trace(2000, seed=1)
+    out = lttb(ts, amp, 150)
+    
+    assert np.all(np.diff(out[:, 0]) > 0)
+    idx = out[:, 0].astype(np.int64) // 100
+    assert np.array_equal(amp[idx], out[:, 1].astype(np.float32))
+
+@pytest.mark.parametrize("n_out", [2, 0, 500, 800])
+def test_lttb_returns_everything_when_not_reducing(n_out):
+    """Too few buckets, or no reduction needed, returns the input unchanged"""
+    ts, amp = _trace(500)
+    out = lttb(ts, amp, n_out)
+    
+    assert out.shape == (500, 2)
+    assert np.array_equal(out[:, 0], ts)
+
+def test_m4_indices_sorted_unique_and_bounded():
+    """Indices are strictly increasing and cover both endpoints"""
+    ts, amp = _trace(10000, seed=2)
+    width = 120
+    idx = m4_indices(ts, amp, width)
+    
+    assert np.all(np.diff(idx) > 0)
+    assert idx[0] == 0
+    assert idx[-1] == len(ts) - 1
+    assert len(idx) <= 4 * width
+
+def test_m4_indices_keep_column_extremes():
+    """Global minimum and maximum always survive"""
+    ts, amp = _trace(5000, seed=3)
+    idx = m4_indices(ts, amp, 50)
+    
+    assert int(np.argmin(amp)) in idx
+    assert int(np.argmax(amp)) in idx
+
+@pytest.mark.parametrize("width", [0, 250, 1000])
+def test_m4_indices_small_input_returns_all(width):
+    """No reduction when there are at most four samples per pixel"""
+    ts, amp = _trace(1000)
+    
+    assert np.array_equal(m4_indices(ts, amp, width), np.arange(1000))
+
+def test_downsample_m4_returns_matching_pairs():
+    """x and y stay aligned after reduction"""
+    ts, amp = _trace(4000, seed=4)
+    x, y = downsample_m4(ts, amp, 40)
+    
+    assert len(x) == len(y)
+    assert np.array_equal(amp[x // 100], y)
@@ -0,0 +1,74 @@
+"""
+Unit tests for the real-time plot ring buffer
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.ring_buffer import RingBuffer
+
+def test_append_keeps_last_window():
+    """Only the last `window` samples are visible, in order"""
+    buf = RingBuffer(4, headroom=2)
+    for i in range(11):
+        buf.append(i)
+    
+    assert len(buf) == 4
+    assert buf.view(0).tolist() == [7, 8, 9, 10]
+    assert buf.last() == 10
+
+def test_view_is_contiguous_and_copy_free():
+    """Views share memory with the storage"""
+    buf = RingBuffer(8, channels=2)
+    buf.extend(np.arange(10, dtype=np.float64).reshape(5, 2))
+    
+    assert buf.view().shape == (2, 5)
+    for channel in range(2):
+        view = buf.view(channel)
+        assert view.flags['C_CONTIGUOUS']
+        assert np.shares_memory(view, buf._data)
+
+def test_extend_block_larger_than_window():
+    """A block longer than the window keeps only its tail"""
+    buf = RingBuffer(5, channels=2, headroom=2)
+    block = np.arange(24, dtype=np.float64).reshape(12, 2)
+    buf.extend(block)
+    
+    assert len(buf) == 5
+    assert buf.view(0).tolist() == block[-5:, 0].tolist()
+    assert buf.view(1).tolist() == block[-5:, 1].tolist()
+
+def test_extend_across_compaction():
+    """Blocks that overflow the storage are compacted without losing order"""
+    buf = RingBuffer(6, headroom=2)
+    expected = []
+    for start in range(0, 40, 3):
+        block = np.arange(start, start + 3, dtype=np.float64)
+        buf.extend(block)
+        expected.extend(block.tolist())
+        assert buf.view(0).tolist() == expected[-6:]
+        assert buf._w <= buf.capacity
+
+def test_extend_casts_to_buffer_dtype():
+    """Input blocks are stored in the buffer dtype"""
+    buf = RingBuffer(4, dtype=np.float32)
+    buf.extend(np.array([1.5, 2.5], dtype=np.float64))
+    
+    assert buf.view(0).dtype == np.float32
+    assert buf.view(0).tolist() == [1.5, 2.5]
+
+def test_clear_and_empty():
+    """An empty buffer has no last value and an empty view"""
+    buf = RingBuffer(3)
+    assert buf.last() is None
+    buf.append(1.0)
+    buf.clear()
+    
+    assert len(buf) == 0
+    assert buf.last() is None
+    assert buf.view(0).size == 0
+
+def test_rejects_non_positive_window():
+    """A zero-length window is a configuration error"""
+    with pytest.raises(ValueError):
+        RingBuffer(0)
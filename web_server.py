@@ -6,12 +6,13 @@ Main entry point for the web dashboard
 import sys
 import argparse
 import asyncio
+import importlib.util
 from pathlib import Path
 import uvicorn
 
 sys.path. insert(0, 'src')
 
-from web.api.vlf_api import create_vlf_web_api
+from web.api.vlf_api import create_vlf_web_api, _protocol_impl
 from core.config_manager import ConfigManager
 from core.logger import setup_logger, get_logger
 
@@ -200,7 +201,10 @@ async def run_server(host: str, port: int, config_path: str, debug: bool, reload
             port=port,
             log_level=log_level. lower(),
             reload=reload,
-            access_log=debug
+            http=_protocol_impl("httptools"),
+            ws=_protocol_impl("websockets"),
+            access_log=debug,
+            ws_per_message_deflate=False
         )
         
         server = uvicorn.Server(uvicorn_config)
@@ -218,6 +222,12 @@ def main():
     """Main entry point"""
     args = parse_arguments()
     
+    # asyncio.run() creates the loop before uvicorn sees its config, so the
+    # uvloop policy has to be installed here rather than via uvicorn's `loop`
+    if importlib.util.find_spec("uvloop") is not None:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         asyncio.run(run_server(
             host=args.host,